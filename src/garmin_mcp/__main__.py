@@ -8,7 +8,6 @@ Usage:
 """
 
 import argparse
-import os
 import sys
 
 
@@ -1,14 +1,13 @@
 """
 Activity tools — MCP registration layer.
 
-Thin wrappers: get_client → api call → json.dumps.
+Thin wrappers: get_client → api call → to_json.
 5 tools (was 13 in activity_management.py).
 """
 
-import json
-
 from fastmcp import Context
 from garmin_mcp.client_factory import get_client
+from garmin_mcp.utils import to_json
 from garmin_mcp.api import activities as api
 
 
@@ -43,12 +42,11 @@ def register_tools(app):
             include_hr_zones: Include time-in-zone breakdown per activity (default false)
         """
         try:
-            return json.dumps(
+            return to_json(
                 api.get_activities(get_client(ctx), start_date, end_date, activity_type, start, limit, include_hr_zones),
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_activity(activity_id: int, ctx: Context) -> str:
@@ -60,9 +58,9 @@ def register_tools(app):
             activity_id: Numeric activity ID
         """
         try:
-            return json.dumps(api.get_activity(get_client(ctx), activity_id), indent=2)
+            return to_json(api.get_activity(get_client(ctx), activity_id))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_activity_splits(activity_id: int, ctx: Context) -> str:
@@ -72,9 +70,9 @@ def register_tools(app):
             activity_id: Numeric activity ID
         """
         try:
-            return json.dumps(api.get_activity_splits(get_client(ctx), activity_id), indent=2)
+            return to_json(api.get_activity_splits(get_client(ctx), activity_id))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_activity_hr_in_timezones(activity_id: int, ctx: Context) -> str:
@@ -84,16 +82,16 @@ def register_tools(app):
             activity_id: Numeric activity ID
         """
         try:
-            return json.dumps(api.get_activity_hr_in_timezones(get_client(ctx), activity_id), indent=2)
+            return to_json(api.get_activity_hr_in_timezones(get_client(ctx), activity_id))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_activity_types(ctx: Context) -> str:
         """All available activity type codes (reference data for filtering)."""
         try:
-            return json.dumps(api.get_activity_types(get_client(ctx)), indent=2)
+            return to_json(api.get_activity_types(get_client(ctx)))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     return app
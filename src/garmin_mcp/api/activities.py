@@ -8,9 +8,10 @@ Returns {"error": "..."} for missing data.
 import logging
 import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 from garminconnect import Garmin
-from garmin_mcp.utils import clean_nones
+from garmin_mcp.utils import clean_nones, validate_date
 
 logger = logging.getLogger(__name__)
 
@@ -77,9 +78,15 @@ def get_activity(client: Garmin, activity_id: int) -> dict:
     if not raw:
         return {"error": f"No activity found with ID {activity_id}"}
 
-    summary = raw.get("summaryDTO", {})
-    activity_type = raw.get("activityTypeDTO", {})
-    metadata = raw.get("metadataDTO", {})
+    # Weather only for activities that exist — it is fetched while the
+    # detail is curated. shutdown(wait=False) lets the one task finish.
+    pool = ThreadPoolExecutor(max_workers=1)
+    weather_future = pool.submit(client.get_activity_weather, activity_id)
+    pool.shutdown(wait=False)
+
+    summary = raw.get("summaryDTO") or {}
+    activity_type = raw.get("activityTypeDTO") or {}
+    metadata = raw.get("metadataDTO") or {}
 
     result = clean_nones({
         "id": raw.get("activityId"),
@@ -131,7 +138,7 @@ def get_activity(client: Garmin, activity_id: int) -> dict:
 
     # Try to get weather inline
     try:
-        weather = client.get_activity_weather(activity_id)
+        weather = weather_future.result()
         if weather:
             result["weather"] = clean_nones({
                 "temperature_celsius": round((weather["temp"] - 32) * 5 / 9, 1) if weather.get("temp") is not None else None,
@@ -231,7 +238,7 @@ def download_activity(client: Garmin, activity_id: int, fmt: str = "fit", sandbo
         file_path = os.path.join(sandbox, f"activity_{activity_id}.{fmt}")
         with open(file_path, "wb") as f:
             f.write(content)
-        size_kb = round(os.path.getsize(file_path) / 1024, 1)
+        size_kb = round(len(content) / 1024, 1)
         return {"activity_id": activity_id, "format": fmt, "path": file_path, "size_kb": size_kb}
 
     # ── FIT → CSV preprocessing ──────────────────────────────────────────
@@ -247,18 +254,12 @@ def _fit_to_csv(zip_bytes: bytes, activity_id: int, sandbox: str) -> dict:
     import io
     from fitparse import FitFile
 
-    # Extract .fit from zip
-    zip_path = os.path.join(sandbox, f"_tmp_{activity_id}.zip")
-    with open(zip_path, "wb") as f:
-        f.write(zip_bytes)
-    try:
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            fit_names = [n for n in zf.namelist() if n.endswith(".fit")]
-            if not fit_names:
-                return {"error": "No .fit file found in downloaded zip"}
-            fit_bytes = zf.read(fit_names[0])
-    finally:
-        os.remove(zip_path)
+    # Extract .fit from zip (in memory — the archive is already in RAM)
+    with zipfile.ZipFile(io.BytesIO(zip_bytes), "r") as zf:
+        fit_names = [n for n in zf.namelist() if n.endswith(".fit")]
+        if not fit_names:
+            return {"error": "No .fit file found in downloaded zip"}
+        fit_bytes = zf.read(fit_names[0])
 
     # Parse FIT
     fit = FitFile(io.BytesIO(fit_bytes))
@@ -273,26 +274,30 @@ def _fit_to_csv(zip_bytes: bytes, activity_id: int, sandbox: str) -> dict:
     cadence_label = "cadence_spm" if is_running else "cadence_rpm"
     cadence_multiplier = 2 if is_running else 1
 
+    # One iteration per second of recording — hoist the attribute lookups
     rows = []
+    append_row = rows.append
     first_ts = None
     for record in fit.get_messages("record"):
         raw = {f.name: f.value for f in record.fields}
+        get = raw.get
 
-        ts = raw.get("timestamp")
+        ts = get("timestamp")
         if ts is None:
             continue
         if first_ts is None:
             first_ts = ts
 
-        speed = raw.get("enhanced_speed") or raw.get("speed")
-        altitude = raw.get("enhanced_altitude") or raw.get("altitude")
-        cadence_rpm = raw.get("cadence")
-        frac_cadence = raw.get("fractional_cadence") or 0.0
+        speed = get("enhanced_speed") or get("speed")
+        altitude = get("enhanced_altitude") or get("altitude")
+        cadence_rpm = get("cadence")
+        frac_cadence = get("fractional_cadence") or 0.0
 
         row = {"timestamp": ts.isoformat()}
         row["elapsed_s"] = round((ts - first_ts).total_seconds(), 1)
-        row["distance_m"] = round(raw["distance"], 1) if raw.get("distance") is not None else None
-        row["heart_rate"] = raw.get("heart_rate")
+        distance = get("distance")
+        row["distance_m"] = round(distance, 1) if distance is not None else None
+        row["heart_rate"] = get("heart_rate")
 
         # Cadence: running RPM×2 → SPM, cycling stays RPM
         if cadence_rpm is not None:
@@ -310,25 +315,25 @@ def _fit_to_csv(zip_bytes: bytes, activity_id: int, sandbox: str) -> dict:
         row["altitude_m"] = round(altitude, 1) if altitude is not None else None
 
         # GPS: semicircles → degrees
-        lat = raw.get("position_lat")
-        lon = raw.get("position_long")
+        lat = get("position_lat")
+        lon = get("position_long")
         row["lat"] = round(lat * _SEMICIRCLES_TO_DEG, 6) if lat is not None else None
         row["lon"] = round(lon * _SEMICIRCLES_TO_DEG, 6) if lon is not None else None
 
-        row["temperature_c"] = raw.get("temperature")
+        row["temperature_c"] = get("temperature")
 
         # Running dynamics (optional)
-        row["vertical_oscillation_mm"] = raw.get("vertical_oscillation")
-        row["ground_contact_time_ms"] = raw.get("stance_time")
-        row["ground_contact_balance_pct"] = raw.get("stance_time_balance")
-        step_len = raw.get("step_length")
+        row["vertical_oscillation_mm"] = get("vertical_oscillation")
+        row["ground_contact_time_ms"] = get("stance_time")
+        row["ground_contact_balance_pct"] = get("stance_time_balance")
+        step_len = get("step_length")
         row["step_length_cm"] = round(step_len / 10, 1) if step_len is not None else None
-        row["vertical_ratio_pct"] = raw.get("vertical_ratio")
+        row["vertical_ratio_pct"] = get("vertical_ratio")
 
         # Power (optional)
-        row["power_w"] = raw.get("power")
+        row["power_w"] = get("power")
 
-        rows.append(row)
+        append_row(row)
 
     if not rows:
         return {"error": "No record data found in FIT file"}
@@ -407,6 +412,15 @@ def _first_not_none(d: dict, *keys):
 # Fields only available via GraphQL activitiesScalar (not in REST list)
 _GRAPHQL_ONLY_FIELDS = {"training_load"}
 
+# activitiesScalar query — dates are validated before substitution since they
+# are interpolated into the query text.
+_ACTIVITIES_SCALAR_QUERY = (
+    'query{{activitiesScalar(displayName:"{display_name}", '
+    'startTimestampLocal:"{start_date}T00:00:00.00", '
+    'endTimestampLocal:"{end_date}T23:59:59.999", '
+    'limit:200)}}'
+)
+
 
 def _needs_graphql(fields: list[str] | None) -> bool:
     """Check if requested fields include GraphQL-only data."""
@@ -431,16 +445,14 @@ def _maybe_enrich_graphql(
             logger.warning("GraphQL enrichment skipped: no display_name on client")
             return
         gql_data = client.query_garmin_graphql({
-            "query": f'query{{activitiesScalar(displayName:"{display_name}", '
-                     f'startTimestampLocal:"{start_date}T00:00:00.00", '
-                     f'endTimestampLocal:"{end_date}T23:59:59.999", '
-                     f'limit:200)}}'
+            "query": _ACTIVITIES_SCALAR_QUERY.format(
+                display_name=display_name,
+                start_date=validate_date(start_date),
+                end_date=validate_date(end_date),
+            )
         })
-        gql_activities = (
-            gql_data.get("data", {})
-            .get("activitiesScalar", {})
-            .get("activityList", [])
-        )
+        scalar = (gql_data.get("data") or {}).get("activitiesScalar") or {}
+        gql_activities = scalar.get("activityList")
         if not gql_activities:
             logger.info("GraphQL enrichment: no activities returned for %s..%s", start_date, end_date)
             return
@@ -465,11 +477,20 @@ def _maybe_enrich_graphql_from_activities(
     """Derive date range from activities and enrich via GraphQL."""
     if not _needs_graphql(fields):
         return
-    # Extract date range from start_time fields
-    dates = [a.get("start_time", "")[:10] for a in activities if a.get("start_time")]
-    if not dates:
+    # Extract date range from start_time fields — one pass for both bounds
+    first = last = None
+    for a in activities:
+        start_time = a.get("start_time")
+        if not start_time:
+            continue
+        day = start_time[:10]
+        if first is None or day < first:
+            first = day
+        if last is None or day > last:
+            last = day
+    if first is None:
         return
-    _maybe_enrich_graphql(client, activities, min(dates), max(dates), fields)
+    _maybe_enrich_graphql(client, activities, first, last, fields)
 
 
 def _enrich_hr_zones(client: Garmin, activities: list[dict], raw: list[dict]) -> None:
@@ -66,7 +66,7 @@ def get_device_capabilities(client: Garmin) -> dict:
     except Exception:
         return {"capabilities": {}, "disabled_tools": []}
 
-    flags = indicators.get("deviceBasedIndicators", {})
+    flags = indicators.get("deviceBasedIndicators") or {}
     if not isinstance(flags, dict):
         return {"capabilities": {}, "disabled_tools": []}
 
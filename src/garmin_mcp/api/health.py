@@ -59,13 +59,26 @@ def get_stress(client: Garmin, date: str) -> dict:
     # Calculate distribution from time-series
     values = raw.get("stressValuesArray", [])
     if values:
-        valid = [v[1] for v in values if v[1] and v[1] > 0]
-        if valid:
-            total = len(valid)
-            summary["rest_percent"] = round(sum(1 for v in valid if v < 26) / total * 100, 1)
-            summary["low_stress_percent"] = round(sum(1 for v in valid if 26 <= v < 51) / total * 100, 1)
-            summary["medium_stress_percent"] = round(sum(1 for v in valid if 51 <= v < 76) / total * 100, 1)
-            summary["high_stress_percent"] = round(sum(1 for v in valid if v >= 76) / total * 100, 1)
+        # One pass: bucket each reading as rest / low / medium / high
+        counts = [0, 0, 0, 0]
+        for v in values:
+            level = v[1]
+            if not level or level <= 0:
+                continue
+            if level < 26:
+                counts[0] += 1
+            elif level < 51:
+                counts[1] += 1
+            elif level < 76:
+                counts[2] += 1
+            else:
+                counts[3] += 1
+        total = sum(counts)
+        if total:
+            summary["rest_percent"] = round(counts[0] / total * 100, 1)
+            summary["low_stress_percent"] = round(counts[1] / total * 100, 1)
+            summary["medium_stress_percent"] = round(counts[2] / total * 100, 1)
+            summary["high_stress_percent"] = round(counts[3] / total * 100, 1)
 
     return summary
 
@@ -134,7 +147,7 @@ def get_body_battery(client: Garmin, start_date: str, end_date: str) -> dict:
         if events:
             entry["events"] = events
 
-        feedback = day.get("bodyBatteryDynamicFeedbackEvent", {})
+        feedback = day.get("bodyBatteryDynamicFeedbackEvent") or {}
         if feedback:
             entry["current_feedback"] = feedback.get("feedbackShortType")
             entry["body_battery_level"] = feedback.get("bodyBatteryLevel")
@@ -168,9 +181,7 @@ def get_training_readiness(client: Garmin, date: str) -> dict:
 
     # API can return a list
     entries = raw if isinstance(raw, list) else [raw]
-    curated = []
-    for r in entries:
-        curated.append(_curate_readiness_entry(r))
+    curated = [_curate_readiness_entry(r) for r in entries]
 
     if len(curated) == 1:
         return curated[0]
@@ -228,10 +239,10 @@ def _curate_stats(stats: dict) -> dict:
 
 def _curate_sleep(sleep_data: dict) -> dict:
     """Extract essential fields from sleep data."""
-    dto = sleep_data.get("dailySleepDTO", {})
+    dto = sleep_data.get("dailySleepDTO") or {}
     if not dto:
         return {}
-    scores = dto.get("sleepScores", {}).get("overall", {})
+    scores = (dto.get("sleepScores") or {}).get("overall") or {}
     total_sec = dto.get("sleepTimeSeconds", 0)
 
     result = clean_nones({
@@ -247,7 +258,7 @@ def _curate_sleep(sleep_data: dict) -> dict:
     })
 
     # SpO2 during sleep
-    spo2 = sleep_data.get("wellnessSpO2SleepSummaryDTO", {})
+    spo2 = sleep_data.get("wellnessSpO2SleepSummaryDTO") or {}
     if spo2:
         result["avg_spo2"] = spo2.get("averageSpo2")
         result["lowest_spo2"] = spo2.get("lowestSpo2")
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 from garminconnect import Garmin
 
@@ -72,8 +72,8 @@ VALID_SPORTS: tuple[str, ...] = ("running", "cycling")
 
 def _daterange(start: str, end: str) -> list[str]:
     """Inclusive list of YYYY-MM-DD strings from start to end."""
-    s = datetime.strptime(start, "%Y-%m-%d").date()
-    e = datetime.strptime(end, "%Y-%m-%d").date()
+    s = date.fromisoformat(start)
+    e = date.fromisoformat(end)
     if e < s:
         return []
     out = []
@@ -239,8 +239,8 @@ _SLEEP_MAX_WINDOW_DAYS = 28
 
 def _chunk_range(start: str, end: str, chunk_days: int) -> list[tuple[str, str]]:
     """Split [start, end] inclusive into chunks of at most `chunk_days`."""
-    s = datetime.strptime(start, "%Y-%m-%d").date()
-    e = datetime.strptime(end, "%Y-%m-%d").date()
+    s = date.fromisoformat(start)
+    e = date.fromisoformat(end)
     chunks = []
     cur = s
     while cur <= e:
@@ -274,29 +274,24 @@ def get_sleep(client: Garmin, start_date: str, end_date: str) -> list[dict]:
             logger.debug("history sleep: chunk %s..%s failed: %s", s, e, exc)
             return None
 
-    rows: list[dict] = []
+    # Keyed on date so the dedupe happens on insert (chunk boundaries
+    # shouldn't overlap, but guard anyway) — first row for a date wins.
+    by_date: dict[str, dict] = {}
     with ThreadPoolExecutor(max_workers=_DAILY_WORKERS) as pool:
         for resp in pool.map(_fetch, chunks):
             if not resp:
                 continue
             for entry in (resp.get("individualStats") or []):
-                values = entry.get("values") or {}
-                rows.append({
-                    "date": entry.get("calendarDate"),
-                    **values,
-                })
+                d = entry.get("calendarDate")
+                key = str(d or "")
+                if key in by_date:
+                    continue
+                by_date[key] = {
+                    "date": d,
+                    **(entry.get("values") or {}),
+                }
 
-    rows.sort(key=lambda r: str(r.get("date") or ""))
-    # Dedupe on date (chunk boundaries shouldn't overlap, but guard anyway)
-    seen: set[str] = set()
-    deduped = []
-    for r in rows:
-        d = r.get("date") or ""
-        if d in seen:
-            continue
-        seen.add(d)
-        deduped.append(r)
-    return deduped
+    return [by_date[key] for key in sorted(by_date)]
 
 
 HEART_RATE_AGGREGATIONS = ("daily", "weekly")
@@ -374,7 +369,8 @@ def get_heart_rate(
             logger.debug("history heart-rate: chunk %s..%s failed: %s", s, e, exc)
             return None
 
-    rows: list[dict] = []
+    # Same dedupe-on-insert as get_sleep: duplicates are never built.
+    by_date: dict[str, dict] = {}
     with ThreadPoolExecutor(max_workers=_DAILY_WORKERS) as pool:
         for resp in pool.map(_fetch, chunks):
             if not resp:
@@ -382,23 +378,17 @@ def get_heart_rate(
             for entry in resp:
                 if not isinstance(entry, dict):
                     continue
-                values = entry.get("values") or {}
-                row = {"date": entry.get("calendarDate"), **values}
+                d = entry.get("calendarDate")
+                key = str(d or "")
+                if key in by_date:
+                    continue
+                row = {"date": d, **(entry.get("values") or {})}
                 # Seed canonical keys for schema stability (see _HR_DAILY_CANONICAL).
                 for k in _HR_DAILY_CANONICAL:
                     row.setdefault(k, None)
-                rows.append(row)
+                by_date[key] = row
 
-    rows.sort(key=lambda r: str(r.get("date") or ""))
-    seen: set[str] = set()
-    deduped = []
-    for r in rows:
-        d = r.get("date") or ""
-        if d in seen:
-            continue
-        seen.add(d)
-        deduped.append(r)
-    return deduped
+    return [by_date[key] for key in sorted(by_date)]
 
 
 VO2MAX_AGGREGATIONS = ("daily", "weekly", "monthly")
@@ -465,8 +455,8 @@ def get_race_predictions(
     Garmin caps this endpoint at 365 days — pre-flight check raises a clear
     ValueError before the HTTP call, instead of letting the server 400 silently.
     """
-    s = datetime.strptime(start_date, "%Y-%m-%d").date()
-    e = datetime.strptime(end_date, "%Y-%m-%d").date()
+    s = date.fromisoformat(start_date)
+    e = date.fromisoformat(end_date)
     days = (e - s).days
     if days > 365:
         raise ValueError(
@@ -5,6 +5,8 @@ Pure functions: (Garmin client, params) → dict.
 Merges user_profile + settings + unit_system + devices into 3 calls.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from garminconnect import Garmin
 from garmin_mcp.utils import clean_nones
 
@@ -42,7 +44,12 @@ def get_user_profile(client) -> dict:
 
     Note: HR/power zone boundaries are NOT in user-settings — use get_hr_zones() instead.
     """
-    profile = client.get_user_profile()
+    # Unit system doesn't depend on the profile — fetch both at once
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        profile_future = pool.submit(client.get_user_profile)
+        unit_system_future = pool.submit(client.get_unit_system)
+
+    profile = profile_future.result()
     if not profile:
         return {"error": "No user profile found"}
 
@@ -55,7 +62,7 @@ def get_user_profile(client) -> dict:
     })
 
     # User data is inside the profile response, not settings
-    user_data = profile.get("userData", {})
+    user_data = profile.get("userData") or {}
     if user_data:
         result["settings"] = clean_nones({
             "weight_kg": _safe_div(user_data.get("weight"), 1000),
@@ -103,38 +110,31 @@ def get_user_profile(client) -> dict:
             result["power_zones"] = zones["power_zones"]
 
     # Merge unit system
-    try:
-        unit_system = client.get_unit_system()
-        if unit_system:
-            result["unit_system"] = unit_system
-    except Exception:
-        pass
+    unit_system = _optional_result(unit_system_future)
+    if unit_system:
+        result["unit_system"] = unit_system
 
     return result
 
 
 def get_devices(client) -> dict:
     """Enriched device list with last-used and primary flags."""
-    devices = client.get_devices()
+    # The three lookups are independent — fetch them concurrently so the
+    # tool costs one round trip instead of three.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        devices_future = pool.submit(client.get_devices)
+        last_used_future = pool.submit(client.get_device_last_used)
+        primary_future = pool.submit(client.get_primary_training_device)
+
+    devices = devices_future.result()
     if not devices:
         return {"error": "No devices found"}
 
-    # Fetch last-used and primary training device for enrichment
-    last_used_id = None
-    primary_id = None
-    try:
-        last_used = client.get_device_last_used()
-        if last_used and isinstance(last_used, dict):
-            last_used_id = last_used.get("deviceId")
-    except Exception:
-        pass
-
-    try:
-        primary = client.get_primary_training_device()
-        if primary and isinstance(primary, dict):
-            primary_id = primary.get("deviceId")
-    except Exception:
-        pass
+    # Last-used and primary training device are enrichment only
+    last_used = _optional_result(last_used_future)
+    last_used_id = last_used.get("deviceId") if isinstance(last_used, dict) else None
+    primary = _optional_result(primary_future)
+    primary_id = primary.get("deviceId") if isinstance(primary, dict) else None
 
     curated = []
     for d in devices:
@@ -158,6 +158,14 @@ def get_devices(client) -> dict:
 
 # ── helpers ───────────────────────────────────────────────────────────────────
 
+def _optional_result(future: Future):
+    """Result of an enrichment call, or None if it failed."""
+    try:
+        return future.result()
+    except Exception:
+        return None
+
+
 def _fetch_zones_from_activity(client: Garmin) -> dict:
     """Fetch HR + power zone boundaries from the most recent activity."""
     try:
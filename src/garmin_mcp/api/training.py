@@ -132,16 +132,17 @@ def get_progress_summary(
     total_activities = 0
     for entry in entries:
         total_activities += entry.get("countOfActivities", 0)
-        stats = entry.get("stats", {})
+        stats = entry.get("stats") or {}
         for sport, metrics in stats.items():
-            metric_data = metrics.get(metric, {})
-            if sport not in sport_totals:
-                sport_totals[sport] = {"count": 0, "sum": 0.0}
-            sport_totals[sport]["count"] += metric_data.get("count", 0)
-            sport_totals[sport]["sum"] += metric_data.get("sum", 0.0)
-            sport_totals[sport]["avg"] = metric_data.get("avg")
-            sport_totals[sport]["min"] = metric_data.get("min")
-            sport_totals[sport]["max"] = metric_data.get("max")
+            metric_data = metrics.get(metric) or {}
+            totals = sport_totals.get(sport)
+            if totals is None:
+                totals = sport_totals[sport] = {"count": 0, "sum": 0.0}
+            totals["count"] += metric_data.get("count", 0)
+            totals["sum"] += metric_data.get("sum", 0.0)
+            totals["avg"] = metric_data.get("avg")
+            totals["min"] = metric_data.get("min")
+            totals["max"] = metric_data.get("max")
 
     # Build curated per-sport entries
     curated_entries = []
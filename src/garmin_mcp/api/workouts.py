@@ -8,9 +8,15 @@ Pydantic models and normalization logic moved here from the old tool layer.
 import copy
 import json
 import datetime
+import hashlib
+import itertools
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 
+import orjson
 from pydantic import BaseModel, Field
 
 from garmin_mcp.utils import clean_nones
@@ -127,6 +133,45 @@ TARGET_TYPE_MAP = {
     'pace.zone': {'workoutTargetTypeId': 6, 'workoutTargetTypeKey': 'pace.zone'},
 }
 
+# Normalization lookups — built once here, not per step.
+STEP_TYPE_ID_MAP = {key: st['stepTypeId'] for key, st in STEP_TYPE_MAP.items()}
+
+CONDITION_DISPLAY_ORDER = {'lap.button': 1, 'time': 2, 'distance': 3, 'calories': 4, 'heart.rate': 6}
+
+TARGET_DISPLAY_ORDER = {
+    'no.target': 1, 'speed.zone': 2, 'cadence': 3,
+    'heart.rate.zone': 4, 'power.zone': 5, 'pace.zone': 6,
+}
+
+# Highest zone number per zone-based target type.
+_ZONE_TARGET_MAX = {'heart.rate.zone': 5, 'power.zone': 7}
+
+# Scalar repeat-group defaults, merged under the step's own fields.
+_REPEAT_GROUP_DEFAULTS = {'skipLastRestStep': True, 'smartRepeat': False}
+
+# Step defaults — always .copy() before attaching, normalized steps get mutated.
+_ITERATIONS_END_CONDITION = {
+    'conditionTypeId': 7,
+    'conditionTypeKey': 'iterations',
+    'displayOrder': 7,
+    'displayable': False,
+}
+_NO_TARGET = {
+    'workoutTargetTypeId': 1,
+    'workoutTargetTypeKey': 'no.target',
+    'displayOrder': 1,
+}
+_DEFAULT_STROKE_TYPE = {'strokeTypeId': 0, 'displayOrder': 0}
+_DEFAULT_EQUIPMENT_TYPE = {'equipmentTypeId': 0, 'displayOrder': 0}
+
+# Simplified target value keys → Garmin keys, first match wins.
+_TARGET_VALUE_ALIASES = (
+    ('targetValueOne', 'targetValueOne'),
+    ('targetValueTwo', 'targetValueTwo'),
+    ('targetValueHigh', 'targetValueOne'),
+    ('targetValueLow', 'targetValueTwo'),
+)
+
 
 # =============================================================================
 # PREPROCESSING — simplified AI format → full Garmin format
@@ -156,16 +201,17 @@ def _preprocess_step(step: dict) -> dict:
 
     ec = step.get('endCondition', step.get('endConditionType'))
     if isinstance(ec, str):
-        result['endCondition'] = CONDITION_TYPE_MAP.get(ec, CONDITION_TYPE_MAP['lap.button']).copy()
+        end_condition = CONDITION_TYPE_MAP.get(ec, CONDITION_TYPE_MAP['lap.button']).copy()
     elif isinstance(ec, dict):
-        result['endCondition'] = ec
+        end_condition = ec
     else:
-        result['endCondition'] = CONDITION_TYPE_MAP['lap.button'].copy()
+        end_condition = CONDITION_TYPE_MAP['lap.button'].copy()
+    result['endCondition'] = end_condition
 
-    if 'endConditionValue' in step and step['endConditionValue'] is not None:
-        val = step['endConditionValue']
+    val = step.get('endConditionValue')
+    if val is not None:
         # Guard: time endConditionValue is in SECONDS — reject likely millisecond mistakes
-        ec_key = result.get('endCondition', {}).get('conditionTypeKey', '')
+        ec_key = end_condition.get('conditionTypeKey', '')
         if ec_key == 'time' and val > 36000:  # > 10 hours
             raise ValueError(
                 f"endConditionValue={val} seconds ({val/3600:.1f}h) is unreasonably large. "
@@ -183,14 +229,10 @@ def _preprocess_step(step: dict) -> dict:
     elif isinstance(tt, dict) and 'workoutTargetTypeId' in tt:
         result['targetType'] = tt
 
-    for src, dst in [
-        ('targetValueOne', 'targetValueOne'),
-        ('targetValueTwo', 'targetValueTwo'),
-        ('targetValueHigh', 'targetValueOne'),
-        ('targetValueLow', 'targetValueTwo'),
-    ]:
-        if src in step and step[src] is not None and dst not in result:
-            result[dst] = step[src]
+    for src, dst in _TARGET_VALUE_ALIASES:
+        value = step.get(src)
+        if value is not None and dst not in result:
+            result[dst] = value
 
     if 'zoneNumber' in step:
         result['zoneNumber'] = step['zoneNumber']
@@ -265,15 +307,43 @@ def preprocess_workout_input(data: dict) -> dict:
 # NORMALIZATION — add Garmin-required fields, fix IDs
 # =============================================================================
 
+# Retries and re-uploads of the same template normalize identical payloads.
+# Keyed by the serialized input; values are stored serialized too, so every
+# hit hands back a fresh copy. FIFO eviction, same as the read cache below.
+_NORMALIZE_CACHE_MAX_ENTRIES = 64
+_normalize_cache: dict[bytes, bytes] = {}
+_normalize_cache_lock = threading.Lock()
+
+
 def normalize_workout_structure(workout_data: dict) -> dict:
     """Normalize workout structure to match Garmin API requirements."""
-    normalized = copy.deepcopy(workout_data)
+    # Input is JSON-shaped (model_dump output), so its serialized form is both
+    # the memo key and — loaded back — a C-level clone, far cheaper than
+    # copy.deepcopy's per-node memo bookkeeping. model_dump emits fields in
+    # model order, so the same workout always serializes the same way.
+    key = orjson.dumps(workout_data)
+    with _normalize_cache_lock:
+        hit = _normalize_cache.get(key)
+    if hit is not None:
+        return orjson.loads(hit)
+
+    normalized = _normalize_workout_structure(orjson.loads(key))
+
+    serialized = orjson.dumps(normalized)
+    with _normalize_cache_lock:
+        if key not in _normalize_cache and len(_normalize_cache) >= _NORMALIZE_CACHE_MAX_ENTRIES:
+            del _normalize_cache[next(iter(_normalize_cache))]
+        _normalize_cache[key] = serialized
+    return normalized
 
+
+def _normalize_workout_structure(normalized: dict) -> dict:
+    """Normalize a private copy of a workout in place and return it."""
     normalized.setdefault('avgTrainingSpeed', 2.5)
     normalized.setdefault('estimatedDurationInSecs', 0)
     normalized.setdefault('estimatedDistanceInMeters', 0.0)
 
-    sport_type = normalized.get('sportType', {})
+    sport_type = normalized.get('sportType') or {}
     if sport_type.get('sportTypeKey') == 'running':
         normalized.setdefault('isWheelchair', False)
 
@@ -291,174 +361,147 @@ def normalize_workout_structure(workout_data: dict) -> dict:
 
 
 def _restructure_flat_repeats(steps: list) -> list:
-    """Restructure flat repeat groups into nested structure."""
+    """Restructure flat repeat groups into nested structure.
+
+    Two linear passes: first resolve every repeat's childStepId chain and
+    attach it as workoutSteps, then emit the steps that weren't claimed as
+    children. A child listed before its repeat still moves under it rather
+    than appearing twice, and a repeat claimed by a later repeat keeps its
+    own children.
+    """
     step_map = {}
     for step in steps:
         if 'stepId' in step:
             step_map[step['stepId']] = step
 
     moved_step_ids = set()
-    restructured = []
 
     for step in steps:
+        if 'childStepId' not in step or step.get('workoutSteps'):
+            continue
         if step.get('stepId') in moved_step_ids:
             continue
+        step_type = step.get('stepType') or {}
+        if step_type.get('stepTypeKey') != 'repeat' and not step.get('numberOfIterations'):
+            continue
 
-        is_repeat = (step.get('stepType', {}).get('stepTypeKey') == 'repeat' or
-                     step.get('numberOfIterations'))
-        has_child_id = 'childStepId' in step
-        has_workout_steps = 'workoutSteps' in step and step['workoutSteps']
-
-        if is_repeat and has_child_id and not has_workout_steps:
-            child_steps = []
-            current_child_id = step.get('childStepId')
-
-            while current_child_id and current_child_id in step_map:
-                child_step = step_map[current_child_id]
-                child_steps.append(child_step)
-                moved_step_ids.add(current_child_id)
-                next_child_id = child_step.get('childStepId')
-                if not next_child_id or next_child_id in moved_step_ids:
-                    break
-                current_child_id = next_child_id
-
-            step['workoutSteps'] = child_steps
+        child_steps = []
+        current_child_id = step['childStepId']
+        while current_child_id and current_child_id in step_map and current_child_id not in moved_step_ids:
+            child_step = step_map[current_child_id]
+            child_steps.append(child_step)
+            moved_step_ids.add(current_child_id)
+            current_child_id = child_step.get('childStepId')
+        step['workoutSteps'] = child_steps
 
-        restructured.append(step)
+    return [step for step in steps if step.get('stepId') not in moved_step_ids]
 
-    return restructured
 
+def _normalize_steps(steps: list, next_step_id=None) -> list:
+    """Recursively normalize workout steps.
 
-def _normalize_steps(steps: list, step_id_counter: list = None) -> list:
-    """Recursively normalize workout steps."""
-    if step_id_counter is None:
-        step_id_counter = [1]
+    next_step_id hands out stepIds (1, 2, ...) and is shared across nesting
+    levels so ids stay unique within the segment.
+    """
+    if next_step_id is None:
+        next_step_id = itertools.count(1).__next__
 
-    steps = _restructure_flat_repeats(steps)
+    # Flat childStepId chains only come back from some Garmin GETs; nested
+    # input (the usual case) skips the restructure pass and its step map.
+    if any('childStepId' in step for step in steps):
+        steps = _restructure_flat_repeats(steps)
     normalized_steps = []
 
     for step in steps:
-        step_type_key = step.get('stepType', {}).get('stepTypeKey', '')
+        step_type = step.get('stepType')
+        step_type_key = step_type.get('stepTypeKey', '') if step_type else ''
         if step_type_key == 'repeat' or step.get('numberOfIterations'):
-            normalized_step = _normalize_repeat_group(step, step_id_counter)
+            normalized_step = _normalize_repeat_group(step, next_step_id)
         else:
-            normalized_step = _normalize_executable_step(step, step_id_counter)
+            normalized_step = _normalize_executable_step(step, next_step_id)
         normalized_steps.append(normalized_step)
 
     return normalized_steps
 
 
-def _normalize_repeat_group(step: dict, step_id_counter: list = None) -> dict:
+def _normalize_repeat_group(step: dict, next_step_id=None) -> dict:
     """Normalize a repeat group step."""
-    if step_id_counter is None:
-        step_id_counter = [1]
-
-    normalized = step.copy()
+    if next_step_id is None:
+        next_step_id = itertools.count(1).__next__
 
-    if normalized.get('stepId') is None or not isinstance(normalized.get('stepId'), int):
-        normalized['stepId'] = step_id_counter[0]
-        step_id_counter[0] += 1
+    # One C-level merge: defaults < step fields < forced DTO type
+    normalized = {**_REPEAT_GROUP_DEFAULTS, **step, 'type': 'RepeatGroupDTO'}
 
-    if normalized.get('type') != 'RepeatGroupDTO':
-        normalized['type'] = 'RepeatGroupDTO'
+    if type(normalized.get('stepId')) is not int:
+        normalized['stepId'] = next_step_id()
 
-    if 'stepType' in normalized and 'displayOrder' not in normalized['stepType']:
-        normalized['stepType']['displayOrder'] = 6
+    step_type = normalized.get('stepType')
+    if step_type is not None:
+        step_type.setdefault('displayOrder', 6)
 
     if 'endCondition' not in normalized:
-        normalized['endCondition'] = {
-            'conditionTypeId': 7,
-            'conditionTypeKey': 'iterations',
-            'displayOrder': 7,
-            'displayable': False
-        }
+        normalized['endCondition'] = _ITERATIONS_END_CONDITION.copy()
 
     if 'numberOfIterations' in normalized and 'endConditionValue' not in normalized:
         normalized['endConditionValue'] = float(normalized['numberOfIterations'])
 
-    normalized.setdefault('skipLastRestStep', True)
-    normalized.setdefault('smartRepeat', False)
-
     if 'workoutSteps' in normalized:
-        normalized['workoutSteps'] = _normalize_steps(normalized['workoutSteps'], step_id_counter)
+        normalized['workoutSteps'] = _normalize_steps(normalized['workoutSteps'], next_step_id)
 
     return normalized
 
 
-def _normalize_executable_step(step: dict, step_id_counter: list = None) -> dict:
+def _normalize_executable_step(step: dict, next_step_id=None) -> dict:
     """Normalize an executable workout step."""
-    if step_id_counter is None:
-        step_id_counter = [1]
-
-    normalized = step.copy()
-
-    if normalized.get('stepId') is None or not isinstance(normalized.get('stepId'), int):
-        normalized['stepId'] = step_id_counter[0]
-        step_id_counter[0] += 1
-
-    normalized['type'] = 'ExecutableStepDTO'
-
-    step_type_id_map = {
-        'warmup': 1, 'cooldown': 2, 'interval': 3, 'recovery': 4,
-        'rest': 5, 'repeat': 6, 'other': 7
-    }
-
-    if 'stepType' in normalized:
-        step_type_key = normalized['stepType'].get('stepTypeKey', '')
-        if step_type_key in step_type_id_map:
-            correct_id = step_type_id_map[step_type_key]
-            if normalized['stepType'].get('stepTypeId') != correct_id:
-                normalized['stepType']['stepTypeId'] = correct_id
-        if 'displayOrder' not in normalized['stepType']:
-            if step_type_key in step_type_id_map:
-                normalized['stepType']['displayOrder'] = step_type_id_map[step_type_key]
-
-    if 'endCondition' in normalized:
-        if 'displayOrder' not in normalized['endCondition']:
-            condition_key = normalized['endCondition'].get('conditionTypeKey', '')
-            condition_display_map = {'lap.button': 1, 'time': 2, 'distance': 3, 'calories': 4, 'heart.rate': 6}
-            if condition_key in condition_display_map:
-                normalized['endCondition']['displayOrder'] = condition_display_map[condition_key]
-        if 'displayable' not in normalized['endCondition']:
-            normalized['endCondition']['displayable'] = True
+    if next_step_id is None:
+        next_step_id = itertools.count(1).__next__
+
+    normalized = {**step, 'type': 'ExecutableStepDTO'}
+
+    if type(normalized.get('stepId')) is not int:
+        normalized['stepId'] = next_step_id()
+
+    step_type = normalized.get('stepType')
+    if step_type is not None:
+        type_id = STEP_TYPE_ID_MAP.get(step_type.get('stepTypeKey', ''))
+        if type_id is not None:
+            if step_type.get('stepTypeId') != type_id:
+                step_type['stepTypeId'] = type_id
+            step_type.setdefault('displayOrder', type_id)
+
+    end_condition = normalized.get('endCondition')
+    if end_condition is not None:
+        if 'displayOrder' not in end_condition:
+            display_order = CONDITION_DISPLAY_ORDER.get(end_condition.get('conditionTypeKey', ''))
+            if display_order is not None:
+                end_condition['displayOrder'] = display_order
+        end_condition.setdefault('displayable', True)
 
     # Garmin API requires targetType on every step — default to no.target
-    if 'targetType' not in normalized:
-        normalized['targetType'] = {
-            'workoutTargetTypeId': 1,
-            'workoutTargetTypeKey': 'no.target',
-            'displayOrder': 1,
-        }
-
-    if 'displayOrder' not in normalized['targetType']:
-        target_key = normalized['targetType'].get('workoutTargetTypeKey', '')
-        target_display_map = {'no.target': 1, 'speed.zone': 2, 'cadence': 3, 'heart.rate.zone': 4, 'power.zone': 5, 'pace.zone': 6}
-        normalized['targetType']['displayOrder'] = target_display_map.get(target_key, 1)
-
-    if True:
-        target_key = normalized['targetType'].get('workoutTargetTypeKey', '')
-        if target_key == 'heart.rate.zone':
-            target_one = normalized.get('targetValueOne')
-            target_two = normalized.get('targetValueTwo')
-            if (target_one is not None and target_two is not None and
-                target_one == target_two and 1 <= target_one <= 5):
-                normalized['zoneNumber'] = int(target_one)
-                normalized['targetValueOne'] = None
-                normalized['targetValueTwo'] = None
-        elif target_key == 'power.zone':
-            target_one = normalized.get('targetValueOne')
-            target_two = normalized.get('targetValueTwo')
-            if (target_one is not None and target_two is not None and
-                target_one == target_two and 1 <= target_one <= 7):
-                normalized['zoneNumber'] = int(target_one)
-                normalized['targetValueOne'] = None
-                normalized['targetValueTwo'] = None
+    target_type = normalized.get('targetType')
+    if target_type is None:
+        target_type = normalized['targetType'] = _NO_TARGET.copy()
+
+    target_key = target_type.get('workoutTargetTypeKey', '')
+    if 'displayOrder' not in target_type:
+        target_type['displayOrder'] = TARGET_DISPLAY_ORDER.get(target_key, 1)
+
+    # Single-zone ranges (e.g. HR 3..3) collapse to zoneNumber
+    max_zone = _ZONE_TARGET_MAX.get(target_key)
+    if max_zone is not None:
+        target_one = normalized.get('targetValueOne')
+        target_two = normalized.get('targetValueTwo')
+        if (target_one is not None and target_two is not None and
+            target_one == target_two and 1 <= target_one <= max_zone):
+            normalized['zoneNumber'] = int(target_one)
+            normalized['targetValueOne'] = None
+            normalized['targetValueTwo'] = None
 
     # Garmin API expects numeric 0 defaults, not null — null values cause silent step rejection
     if 'strokeType' not in normalized:
-        normalized['strokeType'] = {'strokeTypeId': 0, 'displayOrder': 0}
+        normalized['strokeType'] = _DEFAULT_STROKE_TYPE.copy()
     if 'equipmentType' not in normalized:
-        normalized['equipmentType'] = {'equipmentTypeId': 0, 'displayOrder': 0}
+        normalized['equipmentType'] = _DEFAULT_EQUIPMENT_TYPE.copy()
 
     return normalized
 
@@ -467,20 +510,60 @@ def _normalize_executable_step(step: dict, step_id_counter: list = None) -> dict
 # CURATION — extract coaching-relevant fields from raw Garmin responses
 # =============================================================================
 
+# Curated values here are flat scalars, so each curator is a field table
+# projected in one pass: (output key, source key, nested key or None).
+# Nones are skipped on insert — no build-then-filter, no recursive clean_nones.
+
+_WORKOUT_SUMMARY_FIELDS = (
+    ("id", 'workoutId', None),
+    ("name", 'workoutName', None),
+    ("sport", 'sportType', 'sportTypeKey'),
+    ("description", 'description', None),
+    ("provider", 'workoutProvider', None),
+    ("created_date", 'createdDate', None),
+    ("updated_date", 'updatedDate', None),
+    ("estimated_duration_seconds", 'estimatedDuration', None),
+    ("estimated_distance_meters", 'estimatedDistance', None),
+)
+
+_SCHEDULED_WORKOUT_FIELDS = (
+    ("date", 'scheduleDate', None),
+    ("schedule_id", 'scheduledWorkoutId', None),
+    ("workout_id", 'workoutId', None),
+    ("name", 'workoutName', None),
+    ("sport", 'workoutType', None),
+    ("estimated_duration_seconds", 'estimatedDurationInSecs', None),
+    ("estimated_distance_meters", 'estimatedDistanceInMeters', None),
+)
+
+
+def _project(source: dict, fields: tuple) -> dict:
+    """Copy the non-None fields listed in a field table into a new dict."""
+    out = {}
+    for out_key, key, nested_key in fields:
+        value = source.get(key)
+        if nested_key is not None:
+            value = value.get(nested_key) if isinstance(value, dict) else None
+        if value is not None:
+            out[out_key] = value
+    return out
+
+
 def _curate_workout_summary(workout: dict) -> dict:
     """Extract essential workout metadata for list views."""
-    sport_type = workout.get('sportType', {})
-    return clean_nones({
-        "id": workout.get('workoutId'),
-        "name": workout.get('workoutName'),
-        "sport": sport_type.get('sportTypeKey'),
-        "description": workout.get('description'),
-        "provider": workout.get('workoutProvider'),
-        "created_date": workout.get('createdDate'),
-        "updated_date": workout.get('updatedDate'),
-        "estimated_duration_seconds": workout.get('estimatedDuration'),
-        "estimated_distance_meters": workout.get('estimatedDistance'),
-    })
+    return _project(workout, _WORKOUT_SUMMARY_FIELDS)
+
+
+def _curate_workout_details(workout: dict) -> dict:
+    """Summary fields plus average speed and the full segment structure."""
+    details = _curate_workout_summary(workout)
+    speed = workout.get('avgTrainingSpeed')
+    if speed is not None:
+        details["avg_training_speed_mps"] = speed
+    segments = workout.get('workoutSegments')
+    if segments:
+        details["segments"] = clean_nones(segments)
+    return details
 
 
 def _curate_scheduled_workout(scheduled: dict) -> dict:
@@ -489,16 +572,74 @@ def _curate_scheduled_workout(scheduled: dict) -> dict:
     SDK returns flat structure: {scheduledWorkoutId, workoutId, workoutName,
     workoutType, scheduleDate, estimatedDurationInSecs, ...}
     """
-    return clean_nones({
-        "date": scheduled.get('scheduleDate'),
-        "schedule_id": scheduled.get('scheduledWorkoutId'),
-        "workout_id": scheduled.get('workoutId'),
-        "name": scheduled.get('workoutName'),
-        "sport": scheduled.get('workoutType'),
-        "completed": scheduled.get('associatedActivityId') is not None,
-        "estimated_duration_seconds": scheduled.get('estimatedDurationInSecs'),
-        "estimated_distance_meters": scheduled.get('estimatedDistanceInMeters'),
-    })
+    curated = _project(scheduled, _SCHEDULED_WORKOUT_FIELDS)
+    curated["completed"] = scheduled.get('associatedActivityId') is not None
+    return curated
+
+
+# =============================================================================
+# READ CACHE — short-lived, per user
+# =============================================================================
+#
+# Agents often re-read the same workout several times in one conversation.
+# Curated results are kept for a short TTL, keyed by a digest of the
+# client's OAuth2 access token. display_name is not used: it arrives
+# unchecked in _meta.context, so it can't keep users apart. Clients
+# without a token are never cached. Any write by a user drops their entries.
+# Entries are copied in and out unless the caller only ever reads them
+# (clone=False), e.g. the raw library list that get_workouts pages over.
+
+_CACHE_TTL_SECONDS = 60
+_CACHE_MAX_ENTRIES = 512
+
+_cache: dict[tuple, tuple[float, dict | list]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_key(client, *parts) -> tuple | None:
+    """Per-credential cache key, or None when the client has no access token."""
+    oauth2_token = getattr(getattr(client, "garth", None), "oauth2_token", None)
+    access_token = getattr(oauth2_token, "access_token", None)
+    if not isinstance(access_token, str) or not access_token:
+        return None
+    return (hashlib.sha256(access_token.encode()).hexdigest(), *parts)
+
+
+def _cache_get(key: tuple | None, clone: bool = True) -> dict | list | None:
+    """Return a live cache entry (a private copy unless clone=False), or None."""
+    if key is None:
+        return None
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del _cache[key]
+            return None
+    return copy.deepcopy(value) if clone else value
+
+
+def _cache_put(key: tuple | None, value: dict | list, clone: bool = True) -> None:
+    """Store value (a copy unless clone=False) under key, evicting the oldest when full."""
+    if key is None:
+        return
+    if clone:
+        value = copy.deepcopy(value)
+    with _cache_lock:
+        if key not in _cache and len(_cache) >= _CACHE_MAX_ENTRIES:
+            del _cache[next(iter(_cache))]
+        _cache[key] = (time.monotonic() + _CACHE_TTL_SECONDS, value)
+
+
+def _cache_invalidate(client) -> None:
+    """Drop every cached entry belonging to this client's user."""
+    key = _cache_key(client)
+    if key is None:
+        return
+    with _cache_lock:
+        for k in [k for k in _cache if k[0] == key[0]]:
+            del _cache[k]
 
 
 # =============================================================================
@@ -518,6 +659,15 @@ _KNOWN_STEP_KEYS = {
 }
 
 
+def _schedule_window() -> tuple[str, str]:
+    """Calendar range searched when resolving schedule entries: -30d .. +365d."""
+    today = datetime.date.today()
+    return (
+        (today - datetime.timedelta(days=30)).isoformat(),
+        (today + datetime.timedelta(days=365)).isoformat(),
+    )
+
+
 def validate_workout_keys(workout_data: dict) -> list[str]:
     """Check for unknown keys that would be silently ignored. Returns list of warnings."""
     warnings = []
@@ -545,54 +695,119 @@ def validate_workout_keys(workout_data: dict) -> list[str]:
     return warnings
 
 
-def prepare_workout_json(workout_data: dict) -> str:
-    """Preprocess, validate, and normalize workout data → JSON string for SDK."""
+def prepare_workout(workout_data: dict) -> dict:
+    """Preprocess, validate, and normalize workout data → payload dict for SDK."""
     warnings = validate_workout_keys(workout_data)
     for w in warnings:
         logger.warning("workout validation: %s", w)
-    logger.debug("prepare_workout_json input: %s", json.dumps(workout_data, default=str))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("prepare_workout input: %s", json.dumps(workout_data, default=str))
     preprocessed = preprocess_workout_input(workout_data)
     validated = WorkoutData(**preprocessed)
     data_dict = validated.model_dump(exclude_none=True)
     normalized = normalize_workout_structure(data_dict)
-    result = json.dumps(normalized)
     # Log step count for debugging workout creation issues
     steps = normalized.get('workoutSegments', [{}])[0].get('workoutSteps', []) if normalized.get('workoutSegments') else []
-    logger.info("prepare_workout_json: %d segments, %d steps", len(normalized.get('workoutSegments', [])), len(steps))
-    logger.debug("prepare_workout_json output: %s", result)
-    return result
+    logger.info("prepare_workout: %d segments, %d steps", len(normalized.get('workoutSegments', [])), len(steps))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("prepare_workout output: %s", json.dumps(normalized))
+    return normalized
+
+
+def prepare_workout_json(workout_data: dict) -> str:
+    """Same as prepare_workout, serialized to a JSON string."""
+    return json.dumps(prepare_workout(workout_data))
+
 
+# Most workouts one call may return or look up: the get_workouts page size
+# and the get_workouts_by_ids batch size.
+_MAX_WORKOUTS_PER_CALL = 100
 
-def get_workouts(client) -> dict:
-    """Get all workouts from the library, curated."""
-    workouts = client.get_workouts()
-    if not workouts:
-        return {"error": "No workouts found"}
+
+def get_workouts(client, start: int = 0, limit: int = _MAX_WORKOUTS_PER_CALL) -> dict:
+    """Get one page of the workout library, curated.
+
+    Only the requested slice is curated and returned, so large libraries
+    don't pay for summaries nobody asked for. `total` is the library size.
+    """
+    start = max(0, start)
+    limit = min(max(1, limit), _MAX_WORKOUTS_PER_CALL)
+
+    # Paging through the library re-reads the same list; keep the raw
+    # response briefly. Curation only reads it, so no copies are needed.
+    key = _cache_key(client, "workouts")
+    workouts = _cache_get(key, clone=False)
+    if workouts is None:
+        workouts = client.get_workouts()
+        if not workouts:
+            return {"error": "No workouts found"}
+        _cache_put(key, workouts, clone=False)
+
+    page = workouts[start:start + limit]
+    has_more = start + limit < len(workouts)
     return {
-        "count": len(workouts),
-        "workouts": [_curate_workout_summary(w) for w in workouts],
+        "total": len(workouts),
+        "start": start,
+        "limit": limit,
+        "count": len(page),
+        "has_more": has_more,
+        "next_start": start + limit if has_more else None,
+        "workouts": list(map(_curate_workout_summary, page)),
     }
 
 
 def get_workout_by_id(client, workout_id: int) -> dict:
     """Get detailed workout info. Returns full structure for editing."""
+    key = _cache_key(client, "workout", workout_id)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
     workout = client.get_workout_by_id(workout_id)
     if not workout:
         return {"error": f"No workout found with ID {workout_id}"}
-    sport_type = workout.get('sportType', {})
-    return clean_nones({
-        "id": workout.get('workoutId'),
-        "name": workout.get('workoutName'),
-        "sport": sport_type.get('sportTypeKey'),
-        "description": workout.get('description'),
-        "provider": workout.get('workoutProvider'),
-        "created_date": workout.get('createdDate'),
-        "updated_date": workout.get('updatedDate'),
-        "estimated_duration_seconds": workout.get('estimatedDuration'),
-        "estimated_distance_meters": workout.get('estimatedDistance'),
-        "avg_training_speed_mps": workout.get('avgTrainingSpeed'),
-        "segments": workout.get('workoutSegments'),
-    })
+    result = _curate_workout_details(workout)
+    _cache_put(key, result)
+    return result
+
+
+# Parallel lookups for get_workouts_by_ids — same budget as history's daily
+# sampling, well under Garmin's per-user rate limits.
+_DETAIL_WORKERS = 8
+
+
+def get_workouts_by_ids(client, workout_ids: list[int]) -> dict:
+    """Get detailed info for several workouts at once, fetched in parallel.
+
+    Results keep the order of workout_ids. A failed lookup becomes
+    {"id": ..., "error": ...} instead of failing the whole batch.
+    """
+    workout_ids = list(dict.fromkeys(workout_ids))
+    if not workout_ids:
+        return {"error": "No workout IDs given"}
+    if len(workout_ids) > _MAX_WORKOUTS_PER_CALL:
+        return {
+            "error": f"Too many workout IDs ({len(workout_ids)}); "
+                     f"at most {_MAX_WORKOUTS_PER_CALL} per call"
+        }
+
+    def _one(workout_id: int) -> dict:
+        try:
+            result = get_workout_by_id(client, workout_id)
+        except Exception as e:
+            return {"id": workout_id, "error": str(e)}
+        if "error" in result:
+            return {"id": workout_id, "error": result["error"]}
+        return result
+
+    workers = min(_DETAIL_WORKERS, len(workout_ids))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        workouts = list(pool.map(_one, workout_ids))
+
+    return {
+        "count": len(workouts),
+        "workouts": workouts,
+    }
 
 
 def get_scheduled_workouts(client, start_date: str, end_date: str) -> dict:
@@ -604,14 +819,15 @@ def get_scheduled_workouts(client, start_date: str, end_date: str) -> dict:
     return {
         "count": len(scheduled),
         "date_range": {"start": start_date, "end": end_date},
-        "scheduled_workouts": [_curate_scheduled_workout(s) for s in scheduled],
+        "scheduled_workouts": list(map(_curate_scheduled_workout, scheduled)),
     }
 
 
 def create_workout(client, workout_data: dict, date: str = None) -> dict:
     """Create a workout and optionally schedule it. Atomic-ish: upload + schedule."""
-    workout_json = prepare_workout_json(workout_data)
-    upload_result = client.upload_workout(workout_json)
+    # upload_workout takes the dict as-is — no dumps here for it to loads again
+    upload_result = client.upload_workout(prepare_workout(workout_data))
+    _cache_invalidate(client)
 
     workout_id = upload_result.get('workoutId') if isinstance(upload_result, dict) else None
     if not workout_id:
@@ -644,12 +860,12 @@ def update_workout(client, workout_id: int, workout_data: dict) -> dict:
     if not existing:
         return {"status": "error", "message": f"Workout {workout_id} not found"}
 
-    workout_json_str = prepare_workout_json(workout_data)
-    normalized = json.loads(workout_json_str)
+    normalized = prepare_workout(workout_data)
     normalized['workoutId'] = workout_id
 
     url = f"/workout-service/workout/{workout_id}"
     response = client.garth.put("connectapi", url, json=normalized, api=True)
+    _cache_invalidate(client)
 
     try:
         result = response.json() if response.text else normalized
@@ -670,10 +886,7 @@ def delete_workout(client, workout_id: int) -> dict:
     unschedule_errors = []
 
     try:
-        today = datetime.date.today()
-        start_date = (today - datetime.timedelta(days=30)).isoformat()
-        end_date = (today + datetime.timedelta(days=365)).isoformat()
-        scheduled = client.get_scheduled_workouts_for_range(start_date, end_date)
+        scheduled = client.get_scheduled_workouts_for_range(*_schedule_window())
 
         for entry in scheduled:
             if entry.get('workoutId') == workout_id:
@@ -688,6 +901,7 @@ def delete_workout(client, workout_id: int) -> dict:
         unschedule_errors.append({"error": f"Failed to query schedules: {e}"})
 
     success = client.delete_workout(workout_id)
+    _cache_invalidate(client)
     if not success:
         return {"status": "failed", "workout_id": workout_id, "message": "Failed to delete workout"}
 
@@ -726,10 +940,7 @@ def reschedule_workout(client, schedule_id: int, new_date: str) -> dict:
     Implemented as unschedule + re-schedule (Garmin's PUT endpoint returns 500).
     """
     # Find the workout_id for this schedule entry
-    today = datetime.date.today()
-    start = (today - datetime.timedelta(days=30)).isoformat()
-    end = (today + datetime.timedelta(days=365)).isoformat()
-    scheduled = client.get_scheduled_workouts_for_range(start, end)
+    scheduled = client.get_scheduled_workouts_for_range(*_schedule_window())
 
     workout_id = None
     workout_name = None
@@ -5,11 +5,11 @@ Thin MCP wrappers over Garmin Connect body data APIs.
 Blood pressure and hydration removed from tool layer (no coaching value).
 SDK/API layer still available if needed.
 """
-import json
 from typing import Optional
 
 from fastmcp import Context
 from garmin_mcp.client_factory import get_client
+from garmin_mcp.utils import clean_nones, to_json
 
 
 def register_tools(app):
@@ -29,7 +29,7 @@ def register_tools(app):
         try:
             raw = get_client(ctx).get_weigh_ins(start_date, end_date)
             if not raw:
-                return json.dumps({"error": f"No weight measurements found between {start_date} and {end_date}."})
+                return to_json({"error": f"No weight measurements found between {start_date} and {end_date}."})
 
             # SDK returns a dict with dailyWeightSummaries → allWeightMetrics
             entries = []
@@ -43,7 +43,7 @@ def register_tools(app):
                 entries = raw
 
             if not entries:
-                return json.dumps({"error": f"No weight measurements found between {start_date} and {end_date}."})
+                return to_json({"error": f"No weight measurements found between {start_date} and {end_date}."})
 
             curated = {
                 "count": len(entries),
@@ -51,7 +51,7 @@ def register_tools(app):
                 "measurements": [],
             }
             for w in entries:
-                m = {
+                curated["measurements"].append(clean_nones({
                     "date": w.get("date") or w.get("calendarDate"),
                     "weight_grams": w.get("weight"),
                     "bmi": w.get("bmi"),
@@ -61,12 +61,11 @@ def register_tools(app):
                     "muscle_mass_grams": w.get("muscleMass"),
                     "source_type": w.get("sourceType"),
                     "timestamp": w.get("timestampLocal") or w.get("timestampGMT"),
-                }
-                curated["measurements"].append({k: v for k, v in m.items() if v is not None})
+                }))
 
-            return json.dumps(curated, indent=2)
+            return to_json(curated)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def add_weigh_in(
@@ -100,9 +99,9 @@ def register_tools(app):
             result = {"status": "success", "weight": weight, "unit": unit_key}
             if date_timestamp:
                 result["timestamp_local"] = date_timestamp
-            return json.dumps(result)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def delete_weigh_ins(date: str, ctx: Context, delete_all: bool = True) -> str:
@@ -114,8 +113,8 @@ def register_tools(app):
         """
         try:
             get_client(ctx).delete_weigh_ins(date, delete_all=delete_all)
-            return json.dumps({"status": "success", "date": date})
+            return to_json({"status": "success", "date": date})
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return to_json({"error": str(e)})
 
     return app
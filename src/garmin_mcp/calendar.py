@@ -4,10 +4,10 @@ Calendar and race event tools for Garmin Connect MCP Server.
 Exposes the athlete's race calendar, competitions, and scheduled events.
 Enables the coach to plan training around target race dates.
 """
-import json
 
 from fastmcp import Context
 from garmin_mcp.client_factory import get_client
+from garmin_mcp.utils import clean_nones, to_json
 
 
 def register_tools(app):
@@ -34,7 +34,7 @@ def register_tools(app):
             if not events:
                 return "No upcoming race events found."
 
-            return json.dumps(_curate_events_response(events), indent=2)
+            return to_json(_curate_events_response(events))
         except Exception as e:
             return f"Error retrieving upcoming race events: {str(e)}"
 
@@ -68,7 +68,7 @@ def register_tools(app):
             if not events:
                 return f"No race events found between {start_date} and {end_date}."
 
-            return json.dumps(_curate_events_response(events), indent=2)
+            return to_json(_curate_events_response(events))
         except Exception as e:
             return f"Error retrieving race events: {str(e)}"
 
@@ -98,27 +98,25 @@ def register_tools(app):
             }
 
             for item in month_data.get("calendarItems", []):
-                curated_item = {
+                curated_item = clean_nones({
                     "date": item.get("date"),
                     "type": item.get("itemType"),
                     "title": item.get("title"),
-                }
+                })
 
                 # Add type-specific fields
-                if item.get("activityTypeId"):
-                    curated_item["activity_type_id"] = item.get("activityTypeId")
-                if item.get("distance"):
-                    curated_item["distance_meters"] = item.get("distance")
-                if item.get("duration"):
-                    curated_item["duration_seconds"] = item.get("duration")
-                if item.get("eventType"):
-                    curated_item["event_type"] = item.get("eventType")
-
-                # Remove None values
-                curated_item = {k: v for k, v in curated_item.items() if v is not None}
+                if activity_type_id := item.get("activityTypeId"):
+                    curated_item["activity_type_id"] = activity_type_id
+                if distance := item.get("distance"):
+                    curated_item["distance_meters"] = distance
+                if duration := item.get("duration"):
+                    curated_item["duration_seconds"] = duration
+                if event_type := item.get("eventType"):
+                    curated_item["event_type"] = event_type
+
                 curated["items"].append(curated_item)
 
-            return json.dumps(curated, indent=2)
+            return to_json(curated)
         except Exception as e:
             return f"Error retrieving calendar month overview: {str(e)}"
 
@@ -138,31 +136,29 @@ def _curate_events_response(events_data) -> list | dict:
     curated = []
     for event in events_list:
         # Prefer uuid (needed for /shareable detail endpoint), fall back to numeric id
-        curated_event = {
+        curated_event = clean_nones({
             "event_id": event.get("uuid") or event.get("id"),
             "name": event.get("eventName") or event.get("name") or event.get("title"),
             "date": event.get("eventDate") or event.get("date"),
             "event_type": event.get("eventType") or event.get("sportType"),
-        }
+        })
 
         # Distance/course info
-        if event.get("distance"):
-            curated_event["distance_meters"] = event.get("distance")
-        if event.get("courseName"):
-            curated_event["course_name"] = event.get("courseName")
-        if event.get("location"):
-            curated_event["location"] = event.get("location")
+        if distance := event.get("distance"):
+            curated_event["distance_meters"] = distance
+        if course_name := event.get("courseName"):
+            curated_event["course_name"] = course_name
+        if location := event.get("location"):
+            curated_event["location"] = location
 
         # Goals
-        if event.get("goalTime"):
-            curated_event["goal_time_seconds"] = event.get("goalTime")
-        if event.get("url"):
-            curated_event["url"] = event.get("url")
-        if event.get("note"):
-            curated_event["note"] = event.get("note")
-
-        # Remove None values
-        curated_event = {k: v for k, v in curated_event.items() if v is not None}
+        if goal_time := event.get("goalTime"):
+            curated_event["goal_time_seconds"] = goal_time
+        if url := event.get("url"):
+            curated_event["url"] = url
+        if note := event.get("note"):
+            curated_event["note"] = note
+
         curated.append(curated_event)
 
     return curated
@@ -170,12 +166,12 @@ def _curate_events_response(events_data) -> list | dict:
 
 def _curate_event_detail(event: dict) -> dict:
     """Curate single event detail to essential fields."""
-    curated = {
+    curated = clean_nones({
         "event_id": event.get("uuid") or event.get("id"),
         "name": event.get("eventName") or event.get("name") or event.get("title"),
         "date": event.get("eventDate") or event.get("date"),
         "event_type": event.get("eventType") or event.get("sportType"),
-    }
+    })
 
     # Detailed fields
     for key in [
@@ -191,5 +187,4 @@ def _curate_event_detail(event: dict) -> dict:
             ).lstrip("_")
             curated[snake_key] = val
 
-    # Remove None values
-    return {k: v for k, v in curated.items() if v is not None}
+    return curated
@@ -906,12 +906,14 @@ def workouts(ctx):
 
 
 @workouts.command("list")
+@click.option("--start", default=0, type=int, help="Pagination offset")
+@click.option("--limit", default=100, type=int, help="Max results (max 100)")
 @click.pass_context
-def workouts_list(ctx):
-    """List all workouts in the library."""
+def workouts_list(ctx, start, limit):
+    """List workouts in the library."""
     from garmin_mcp.api import workouts as api
 
-    _run(ctx, lambda: api.get_workouts(_client(ctx)))
+    _run(ctx, lambda: api.get_workouts(_client(ctx), start, limit))
 
 
 @workouts.command("get")
@@ -1326,8 +1328,9 @@ def calendar_upcoming(ctx, days):
     from garmin_mcp.utils import clean_nones
 
     client = _client(ctx)
-    start = date.today().strftime("%Y-%m-%d")
-    end = (date.today() + timedelta(days=days)).strftime("%Y-%m-%d")
+    today = date.today()
+    start = today.isoformat()
+    end = (today + timedelta(days=days)).isoformat()
     items = client.get_calendar_items_for_range(start, end)
     if not items:
         _out(ctx, {"error": f"No calendar items in the next {days} days"})
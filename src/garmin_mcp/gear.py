@@ -3,9 +3,9 @@ Gear tools — shoes, bikes, accessories (3 tools).
 
 Thin MCP wrappers over Garmin Connect gear API.
 """
-import json
 from fastmcp import Context
 from garmin_mcp.client_factory import get_client
+from garmin_mcp.utils import clean_nones, to_json
 
 
 def register_tools(app):
@@ -24,31 +24,28 @@ def register_tools(app):
             client = get_client(ctx)
             gear_list = client.get_gear(user_profile_id)
             if not gear_list:
-                return json.dumps({"error": "No gear found."})
+                return to_json({"error": "No gear found."})
 
             curated = {"count": len(gear_list), "gear": []}
             for g in gear_list:
-                gear_item = {
+                status_list = g.get("gearStatusDTOList")
+                gear_item = clean_nones({
                     "uuid": g.get("uuid"),
                     "display_name": g.get("displayName"),
                     "model_name": g.get("modelName"),
                     "brand_name": g.get("brandName"),
                     "gear_type": g.get("gearTypePk"),
                     "maximum_distance_meters": g.get("maximumDistanceMeter"),
-                    "current_distance_meters": (
-                        g.get("gearStatusDTOList", [{}])[0].get("totalDistanceInMeters")
-                        if g.get("gearStatusDTOList") else None
-                    ),
+                    "current_distance_meters": status_list[0].get("totalDistanceInMeters") if status_list else None,
                     "date_begun": g.get("dateBegun"),
                     "date_retired": g.get("dateRetired"),
                     "notified": g.get("notified"),
-                }
-                gear_item = {k: v for k, v in gear_item.items() if v is not None}
+                })
                 curated["gear"].append(gear_item)
 
-            return json.dumps(curated, indent=2)
+            return to_json(curated)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def add_gear_to_activity(activity_id: int, gear_uuid: str, ctx: Context) -> str:
@@ -60,13 +57,13 @@ def register_tools(app):
         """
         try:
             get_client(ctx).add_gear_to_activity(gear_uuid, activity_id)
-            return json.dumps({
+            return to_json({
                 "status": "success",
                 "activity_id": activity_id,
                 "gear_uuid": gear_uuid,
             })
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def remove_gear_from_activity(activity_id: int, gear_uuid: str, ctx: Context) -> str:
@@ -78,12 +75,12 @@ def register_tools(app):
         """
         try:
             get_client(ctx).remove_gear_from_activity(gear_uuid, activity_id)
-            return json.dumps({
+            return to_json({
                 "status": "success",
                 "activity_id": activity_id,
                 "gear_uuid": gear_uuid,
             })
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return to_json({"error": str(e)})
 
     return app
@@ -1,14 +1,13 @@
 """
 Health & Wellness tools — MCP registration layer.
 
-Thin wrappers: get_client → api call → json.dumps.
+Thin wrappers: get_client → api call → to_json.
 10 tools (was 28 in health_wellness.py).
 """
 
-import json
-
 from fastmcp import Context
 from garmin_mcp.client_factory import get_client
+from garmin_mcp.utils import to_json
 from garmin_mcp.api import health as api
 
 
@@ -25,9 +24,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_coaching_snapshot(get_client(ctx), date), indent=2)
+            return to_json(api.get_coaching_snapshot(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_stats(date: str, ctx: Context) -> str:
@@ -37,9 +36,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_stats(get_client(ctx), date), indent=2)
+            return to_json(api.get_stats(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_sleep(date: str, ctx: Context) -> str:
@@ -49,9 +48,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_sleep(get_client(ctx), date), indent=2)
+            return to_json(api.get_sleep(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_stress(date: str, ctx: Context) -> str:
@@ -61,9 +60,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_stress(get_client(ctx), date), indent=2)
+            return to_json(api.get_stress(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_heart_rate(date: str, ctx: Context) -> str:
@@ -73,9 +72,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_heart_rate(get_client(ctx), date), indent=2)
+            return to_json(api.get_heart_rate(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_respiration(date: str, ctx: Context) -> str:
@@ -85,9 +84,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_respiration(get_client(ctx), date), indent=2)
+            return to_json(api.get_respiration(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_body_battery(start_date: str, end_date: str, ctx: Context) -> str:
@@ -98,9 +97,9 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_body_battery(get_client(ctx), start_date, end_date), indent=2)
+            return to_json(api.get_body_battery(get_client(ctx), start_date, end_date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_spo2_data(date: str, ctx: Context) -> str:
@@ -110,9 +109,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_spo2(get_client(ctx), date), indent=2)
+            return to_json(api.get_spo2(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_training_readiness(date: str, ctx: Context) -> str:
@@ -122,8 +121,8 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_training_readiness(get_client(ctx), date), indent=2)
+            return to_json(api.get_training_readiness(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     return app
@@ -1,14 +1,13 @@
 """
 Profile & Devices tools — MCP registration layer.
 
-Thin wrappers: get_client → api call → json.dumps.
+Thin wrappers: get_client → api call → to_json.
 4 tools (was 10 in user_profile.py + devices.py).
 """
 
-import json
-
 from fastmcp import Context
 from garmin_mcp.client_factory import get_client
+from garmin_mcp.utils import to_json
 from garmin_mcp.api import profile as api
 from garmin_mcp.api import capabilities as api_capabilities
 
@@ -25,15 +24,15 @@ def register_tools(app):
         try:
             return api.get_full_name(get_client(ctx))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_user_profile(ctx: Context) -> str:
         """User profile: name, weight, height, VO2max, lactate threshold, unit system + HR zones (Z1-Z5) + power zones (Z1-Z7)."""
         try:
-            return json.dumps(api.get_user_profile(get_client(ctx)), indent=2)
+            return to_json(api.get_user_profile(get_client(ctx)))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_hr_zones(ctx: Context) -> str:
@@ -43,9 +42,9 @@ def register_tools(app):
         and low_watts per power zone. Use this to classify efforts by zone.
         """
         try:
-            return json.dumps(api.get_hr_zones(get_client(ctx)), indent=2)
+            return to_json(api.get_hr_zones(get_client(ctx)))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_devices(ctx: Context) -> str:
@@ -54,9 +53,9 @@ def register_tools(app):
         Enriched: combines device list + last-used + primary training device detection.
         """
         try:
-            return json.dumps(api.get_devices(get_client(ctx)), indent=2)
+            return to_json(api.get_devices(get_client(ctx)))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_device_capabilities(ctx: Context) -> str:
@@ -66,8 +65,8 @@ def register_tools(app):
         cached client-side to filter tools before each chat request.
         """
         try:
-            return json.dumps(api_capabilities.get_device_capabilities(get_client(ctx)), indent=2)
+            return to_json(api_capabilities.get_device_capabilities(get_client(ctx)))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     return app
@@ -1,14 +1,13 @@
 """
 Training & Performance tools — MCP registration layer.
 
-Thin wrappers: get_client → api call → json.dumps.
+Thin wrappers: get_client → api call → to_json.
 7 tools (was 10+9 in training.py + challenges.py).
 """
 
-import json
-
 from fastmcp import Context
 from garmin_mcp.client_factory import get_client
+from garmin_mcp.utils import to_json
 from garmin_mcp.api import training as api
 
 
@@ -23,9 +22,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_max_metrics(get_client(ctx), date), indent=2)
+            return to_json(api.get_max_metrics(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_hrv_data(date: str, ctx: Context) -> str:
@@ -35,9 +34,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_hrv_data(get_client(ctx), date), indent=2)
+            return to_json(api.get_hrv_data(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_training_status(date: str, ctx: Context) -> str:
@@ -47,9 +46,9 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_training_status(get_client(ctx), date), indent=2)
+            return to_json(api.get_training_status(get_client(ctx), date))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_progress_summary(
@@ -63,20 +62,19 @@ def register_tools(app):
             metric: One of: distance, duration, elevationGain, movingDuration
         """
         try:
-            return json.dumps(
+            return to_json(
                 api.get_progress_summary(get_client(ctx), start_date, end_date, metric),
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_race_predictions(ctx: Context) -> str:
         """Race time predictions (5K, 10K, half marathon, marathon)."""
         try:
-            return json.dumps(api.get_race_predictions(get_client(ctx)), indent=2)
+            return to_json(api.get_race_predictions(get_client(ctx)))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_goals(ctx: Context, goal_type: str = "active") -> str:
@@ -86,16 +84,16 @@ def register_tools(app):
             goal_type: Type of goals: active, future, or past
         """
         try:
-            return json.dumps(api.get_goals(get_client(ctx), goal_type), indent=2)
+            return to_json(api.get_goals(get_client(ctx), goal_type))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_personal_record(ctx: Context) -> str:
         """Personal records across all activities (fastest 5K, longest run, etc.)."""
         try:
-            return json.dumps(api.get_personal_record(get_client(ctx)), indent=2)
+            return to_json(api.get_personal_record(get_client(ctx)))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     return app
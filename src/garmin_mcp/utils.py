@@ -1,15 +1,22 @@
 """
 Shared utility functions for Garmin MCP server.
 
-Date validation, formatting helpers used across API and tool modules.
+Date validation, formatting and JSON helpers used across API and tool modules.
 """
 
+import os
 import re
-from datetime import datetime
+from datetime import date
+
+import orjson
 
 
 _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
+# Tool output is read by LLMs, not people: compact JSON by default.
+# GARMIN_MCP_PRETTY=1 restores 2-space indentation for debugging.
+PRETTY_JSON = os.environ.get("GARMIN_MCP_PRETTY", "").lower() in ("1", "true", "yes")
+
 
 def clean_nones(d):
     """Recursively strip None values from dicts and lists.
@@ -21,12 +28,36 @@ def clean_nones(d):
         Cleaned structure with all None values removed from dicts.
     """
     if isinstance(d, dict):
-        return {k: clean_nones(v) for k, v in d.items() if v is not None}
+        # Only containers recurse — scalar leaves are copied without a call
+        return {
+            k: clean_nones(v) if isinstance(v, (dict, list)) else v
+            for k, v in d.items()
+            if v is not None
+        }
     if isinstance(d, list):
-        return [clean_nones(i) for i in d]
+        return [clean_nones(i) if isinstance(i, (dict, list)) else i for i in d]
     return d
 
 
+def to_json(obj) -> str:
+    """Serialize a tool response to JSON text.
+
+    Compact by default (roughly half the bytes of indented output), indented
+    with 2 spaces when GARMIN_MCP_PRETTY is set. orjson does the encoding in
+    native code.
+
+    Args:
+        obj: JSON-compatible value (dict keys may be non-str, e.g. int IDs).
+
+    Returns:
+        JSON text.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if PRETTY_JSON:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option).decode()
+
+
 def validate_date(s: str) -> str:
     """Validate YYYY-MM-DD date string.
 
@@ -44,8 +75,9 @@ def validate_date(s: str) -> str:
     s = s.strip()
     if not _DATE_RE.fullmatch(s):
         raise ValueError(f"date must be YYYY-MM-DD, got: {s}")
-    # Verify it's a real date
-    datetime.strptime(s, "%Y-%m-%d")
+    # Verify it's a real date. The regex above already pinned the shape, so the
+    # C-level ISO parser is enough — no strptime format-string parsing.
+    date.fromisoformat(s)
     return s
 
 
@@ -1,10 +1,10 @@
 """
 Women's health functions for Garmin Connect MCP Server
 """
-import json
 
 from fastmcp import Context
 from garmin_mcp.client_factory import get_client
+from garmin_mcp.utils import to_json
 
 
 def register_tools(app):
@@ -17,7 +17,7 @@ def register_tools(app):
             summary = get_client(ctx).get_pregnancy_summary()
             if not summary:
                 return "No pregnancy summary data found."
-            return json.dumps(summary, indent=2)
+            return to_json(summary)
         except Exception as e:
             return f"Error retrieving pregnancy summary: {str(e)}"
     
@@ -32,7 +32,7 @@ def register_tools(app):
             data = get_client(ctx).get_menstrual_data_for_date(date)
             if not data:
                 return f"No menstrual data found for {date}."
-            return json.dumps(data, indent=2)
+            return to_json(data)
         except Exception as e:
             return f"Error retrieving menstrual data: {str(e)}"
     
@@ -48,7 +48,7 @@ def register_tools(app):
             data = get_client(ctx).get_menstrual_calendar_data(start_date, end_date)
             if not data:
                 return f"No menstrual calendar data found between {start_date} and {end_date}."
-            return json.dumps(data, indent=2)
+            return to_json(data)
         except Exception as e:
             return f"Error retrieving menstrual calendar data: {str(e)}"
 
@@ -1,14 +1,18 @@
 """
 Workout tools — MCP registration layer.
 
-Thin wrappers: get_client → api call → json.dumps.
-9 tools (was 12 in workouts.py).
+Thin wrappers: get_client → api call (worker thread) → to_json.
+10 tools (was 12 in workouts.py).
+
+The api layer is synchronous HTTP; calls run via asyncio.to_thread so a
+slow Garmin round trip doesn't block the event loop for other requests.
 """
 
-import json
+import asyncio
 
 from fastmcp import Context
 from garmin_mcp.client_factory import get_client
+from garmin_mcp.utils import to_json
 from garmin_mcp.api import workouts as api
 
 
@@ -16,15 +20,21 @@ def register_tools(app):
     """Register all workout tools with the MCP server app."""
 
     @app.tool()
-    async def get_workouts(ctx: Context) -> str:
-        """Get all workouts from the Garmin Connect library.
+    async def get_workouts(ctx: Context, start: int = 0, limit: int = 100) -> str:
+        """Get workouts from the Garmin Connect library, paginated.
 
         Returns workout summaries with IDs for use with other workout tools.
+        Check has_more / next_start to fetch the next page.
+
+        Args:
+            start: Starting index for pagination (default 0)
+            limit: Max workouts to return (default 100, max 100)
         """
         try:
-            return json.dumps(api.get_workouts(get_client(ctx)), indent=2)
+            result = await asyncio.to_thread(api.get_workouts, get_client(ctx), start, limit)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_workout_by_id(workout_id: int, ctx: Context) -> str:
@@ -36,9 +46,26 @@ def register_tools(app):
             workout_id: ID of the workout to retrieve
         """
         try:
-            return json.dumps(api.get_workout_by_id(get_client(ctx), workout_id), indent=2)
+            result = await asyncio.to_thread(api.get_workout_by_id, get_client(ctx), workout_id)
+            return to_json(result)
+        except Exception as e:
+            return to_json({"error": str(e)})
+
+    @app.tool()
+    async def get_workouts_by_ids(workout_ids: list[int], ctx: Context) -> str:
+        """Get detailed info for several workouts in one call (fetched in parallel).
+
+        Prefer this over repeated get_workout_by_id calls when inspecting
+        multiple workouts from get_workouts.
+
+        Args:
+            workout_ids: IDs of the workouts to retrieve (at most 100)
+        """
+        try:
+            result = await asyncio.to_thread(api.get_workouts_by_ids, get_client(ctx), workout_ids)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def get_scheduled_workouts(start_date: str, end_date: str, ctx: Context) -> str:
@@ -51,9 +78,10 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
         """
         try:
-            return json.dumps(api.get_scheduled_workouts(get_client(ctx), start_date, end_date), indent=2)
+            result = await asyncio.to_thread(api.get_scheduled_workouts, get_client(ctx), start_date, end_date)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def create_workout(workout_data: dict, ctx: Context, date: str = None) -> str:
@@ -79,9 +107,10 @@ def register_tools(app):
             date: Optional schedule date in YYYY-MM-DD format.
         """
         try:
-            return json.dumps(api.create_workout(get_client(ctx), workout_data, date), indent=2)
+            result = await asyncio.to_thread(api.create_workout, get_client(ctx), workout_data, date)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def update_workout(workout_id: int, workout_data: dict, ctx: Context) -> str:
@@ -94,9 +123,10 @@ def register_tools(app):
             workout_data: Complete workout structure.
         """
         try:
-            return json.dumps(api.update_workout(get_client(ctx), workout_id, workout_data), indent=2)
+            result = await asyncio.to_thread(api.update_workout, get_client(ctx), workout_id, workout_data)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def delete_workout(workout_id: int, ctx: Context) -> str:
@@ -109,9 +139,10 @@ def register_tools(app):
             workout_id: ID of the workout to delete (NOT a schedule_id).
         """
         try:
-            return json.dumps(api.delete_workout(get_client(ctx), workout_id), indent=2)
+            result = await asyncio.to_thread(api.delete_workout, get_client(ctx), workout_id)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def schedule_workout(workout_id: int, date: str, ctx: Context) -> str:
@@ -125,9 +156,10 @@ def register_tools(app):
             date: Date to schedule in YYYY-MM-DD format.
         """
         try:
-            return json.dumps(api.schedule_workout(get_client(ctx), workout_id, date), indent=2)
+            result = await asyncio.to_thread(api.schedule_workout, get_client(ctx), workout_id, date)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def unschedule_workout(schedule_id: int, ctx: Context) -> str:
@@ -140,9 +172,10 @@ def register_tools(app):
             schedule_id: The schedule ID (from get_scheduled_workouts or create_workout). NOT the workout ID.
         """
         try:
-            return json.dumps(api.unschedule_workout(get_client(ctx), schedule_id), indent=2)
+            result = await asyncio.to_thread(api.unschedule_workout, get_client(ctx), schedule_id)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     @app.tool()
     async def reschedule_workout(schedule_id: int, new_date: str, ctx: Context) -> str:
@@ -153,8 +186,9 @@ def register_tools(app):
             new_date: New date in YYYY-MM-DD format.
         """
         try:
-            return json.dumps(api.reschedule_workout(get_client(ctx), schedule_id, new_date), indent=2)
+            result = await asyncio.to_thread(api.reschedule_workout, get_client(ctx), schedule_id, new_date)
+            return to_json(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return to_json({"error": str(e)})
 
     return app
@@ -2,8 +2,8 @@
 Shared pytest fixtures for Garmin MCP testing
 """
 import pytest
-from unittest.mock import Mock, patch
-from datetime import datetime, timedelta
+from unittest.mock import Mock
+from datetime import date, timedelta
 from mcp.server.fastmcp import FastMCP
 
 # Tests use mcp.server.fastmcp.FastMCP (has call_tool) but production uses
@@ -13,92 +13,129 @@ import fastmcp
 import mcp.server.fastmcp.server as mcp_server
 fastmcp.Context = mcp_server.Context
 
+from garmin_mcp import activities as garmin_activities
+from garmin_mcp import body_data as garmin_body_data
+from garmin_mcp import gear as garmin_gear
+from garmin_mcp import health as garmin_health
+from garmin_mcp import profile as garmin_profile
+from garmin_mcp import training as garmin_training
+from garmin_mcp import workouts as garmin_workouts
+
+
+# Default return values for the mocked Garmin client, by method name.
+# Methods not listed here return a plain Mock (can be overridden in tests).
+_CLIENT_DEFAULTS = {
+    "get_activities": [],
+    "get_activities_by_date": [],
+    "get_stats": {},
+    "get_user_summary": {},
+    "get_body_composition": {},
+    "get_stats_and_body": {},
+    "get_steps_data": {},
+    "get_daily_steps": {},
+    "get_training_readiness": {},
+    "get_body_battery": {},
+    "get_body_battery_events": {},
+    "get_blood_pressure": {},
+    "get_floors": {},
+    "get_training_status": {},
+    "get_rhr_day": {},
+    "get_heart_rates": {},
+    "get_hydration_data": {},
+    "get_sleep_data": {},
+    "get_stress_data": {},
+    "get_respiration_data": {},
+    "get_spo2_data": {},
+    "get_all_day_stress": {},
+    "get_all_day_events": {},
+    "get_coaching_snapshot": {},
+    "get_hrv_data": {},
+    "get_max_metrics": {},
+    "get_progress_summary_between_dates": {},
+    "get_race_predictions": {},
+    "get_goals": {},
+    "get_personal_record": {},
+    "get_activity": {},
+    "get_activity_splits": {},
+    "get_activity_hr_in_timezones": {},
+    "get_activity_types": [],
+    "get_activity_weather": {},
+    # Profile & devices
+    "get_full_name": "",
+    "get_user_profile": {},
+    "get_userprofile_settings": {},
+    "get_unit_system": None,
+    "get_devices": [],
+    "get_device_last_used": {},
+    "get_primary_training_device": {},
+    "get_usage_indicators": {},
+    # Workouts
+    "get_workouts": [],
+    "get_workout_by_id": {},
+    "upload_workout": {},
+    "schedule_workout": {},
+    "unschedule_workout": True,
+    "delete_workout": True,
+    "reschedule_workout": {},
+    "get_scheduled_workouts_for_range": [],
+    "query_garmin_graphql": {},
+}
+
+
+def _apply_client_defaults(client):
+    """Stub the default return values in one configure_mock pass.
+
+    Containers are copied so tests can mutate them.
+    """
+    client.configure_mock(**{
+        f"{name}.return_value": value.copy() if isinstance(value, (dict, list)) else value
+        for name, value in _CLIENT_DEFAULTS.items()
+    })
 
-@pytest.fixture
-def mock_garmin_client():
-    """Create a mock Garmin client with common methods stubbed"""
+
+@pytest.fixture(scope="session")
+def _session_garmin_client():
+    """One mock Garmin client for the whole run — see mock_garmin_client."""
     client = Mock()
+    _apply_client_defaults(client)
+    return client
 
-    # Configure mock to have all the methods we need
-    # By default, methods return None (can be overridden in tests)
-    client.get_activities = Mock(return_value=[])
-    client.get_activities_by_date = Mock(return_value=[])
-    client.get_stats = Mock(return_value={})
-    client.get_user_summary = Mock(return_value={})
-    client.get_body_composition = Mock(return_value={})
-    client.get_stats_and_body = Mock(return_value={})
-    client.get_steps_data = Mock(return_value={})
-    client.get_daily_steps = Mock(return_value={})
-    client.get_training_readiness = Mock(return_value={})
-    client.get_body_battery = Mock(return_value={})
-    client.get_body_battery_events = Mock(return_value={})
-    client.get_blood_pressure = Mock(return_value={})
-    client.get_floors = Mock(return_value={})
-    client.get_training_status = Mock(return_value={})
-    client.get_rhr_day = Mock(return_value={})
-    client.get_heart_rates = Mock(return_value={})
-    client.get_hydration_data = Mock(return_value={})
-    client.get_sleep_data = Mock(return_value={})
-    client.get_stress_data = Mock(return_value={})
-    client.get_respiration_data = Mock(return_value={})
-    client.get_spo2_data = Mock(return_value={})
-    client.get_all_day_stress = Mock(return_value={})
-    client.get_all_day_events = Mock(return_value={})
-    client.get_coaching_snapshot = Mock(return_value={})
-    client.get_hrv_data = Mock(return_value={})
-    client.get_max_metrics = Mock(return_value={})
-    client.get_progress_summary_between_dates = Mock(return_value={})
-    client.get_race_predictions = Mock(return_value={})
-    client.get_goals = Mock(return_value={})
-    client.get_personal_record = Mock(return_value={})
-    client.get_activity = Mock(return_value={})
-    client.get_activity_splits = Mock(return_value={})
-    client.get_activity_hr_in_timezones = Mock(return_value={})
-    client.get_activity_types = Mock(return_value=[])
-    client.get_activity_weather = Mock(return_value={})
 
-    # Profile & devices
-    client.get_full_name = Mock(return_value="")
-    client.get_user_profile = Mock(return_value={})
-    client.get_userprofile_settings = Mock(return_value={})
-    client.get_unit_system = Mock(return_value=None)
-    client.get_devices = Mock(return_value=[])
-    client.get_device_last_used = Mock(return_value={})
-    client.get_primary_training_device = Mock(return_value={})
-    client.get_usage_indicators = Mock(return_value={})
+@pytest.fixture
+def mock_garmin_client(_session_garmin_client):
+    """Mock Garmin client with common methods stubbed.
 
-    # Workouts
-    client.get_workouts = Mock(return_value=[])
-    client.get_workout_by_id = Mock(return_value={})
-    client.upload_workout = Mock(return_value={})
-    client.schedule_workout = Mock(return_value={})
-    client.unschedule_workout = Mock(return_value=True)
-    client.delete_workout = Mock(return_value=True)
-    client.reschedule_workout = Mock(return_value={})
-    client.get_scheduled_workouts_for_range = Mock(return_value=[])
-    client.query_garmin_graphql = Mock(return_value={})
+    Shared across the session; after each test its call history and any
+    return values / side effects the test set are scrubbed and the
+    defaults re-applied, so every test still starts from a clean client.
+    """
+    yield _session_garmin_client
+    _session_garmin_client.reset_mock(return_value=True, side_effect=True)
+    _apply_client_defaults(_session_garmin_client)
 
-    return client
 
+@pytest.fixture(scope="session")
+def _today():
+    """Today's date, read once so every test agrees on it (even across midnight)"""
+    return date.today()
 
-@pytest.fixture
-def today_str():
+
+@pytest.fixture(scope="session")
+def today_str(_today):
     """Return today's date as YYYY-MM-DD string"""
-    return datetime.now().strftime("%Y-%m-%d")
+    return _today.isoformat()
 
 
-@pytest.fixture
-def yesterday_str():
+@pytest.fixture(scope="session")
+def yesterday_str(_today):
     """Return yesterday's date as YYYY-MM-DD string"""
-    return (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    return (_today - timedelta(days=1)).isoformat()
 
 
-@pytest.fixture
-def date_range():
+@pytest.fixture(scope="session")
+def date_range(_today):
     """Return a tuple of (start_date, end_date) as strings"""
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=7)
-    return (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
+    return ((_today - timedelta(days=7)).isoformat(), _today.isoformat())
 
 
 @pytest.fixture
@@ -201,36 +238,42 @@ def sample_training_status():
     }
 
 
-@pytest.fixture(autouse=True)
-def mock_get_client(mock_garmin_client):
+# Tool modules whose get_client is swapped for the mock client.
+_PATCH_TARGETS = (
+    # New 3-layer modules
+    garmin_health,
+    garmin_activities,
+    garmin_training,
+    garmin_workouts,
+    garmin_profile,
+    # Consolidated modules
+    garmin_gear,
+    garmin_body_data,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_get_client(_session_garmin_client):
     """Auto-mock client_factory.get_client to return the mock Garmin client.
 
-    This patches get_client at the module level in every tool module so that
+    Replaces get_client at the module level in every tool module so that
     tool functions receive the mock client instead of trying to extract
-    tokens from the (non-existent in tests) request context.
+    tokens from the (non-existent in tests) request context. The client
+    is shared for the session (mock_garmin_client scrubs it between
+    tests), so the swap is installed once and undone at session end.
     """
-    modules_to_patch = [
-        # New 3-layer modules
-        "garmin_mcp.health",
-        "garmin_mcp.activities",
-        "garmin_mcp.training",
-        "garmin_mcp.workouts",
-        "garmin_mcp.profile",
-        # Consolidated modules
-        "garmin_mcp.gear",
-        "garmin_mcp.body_data",
-    ]
-
-    patchers = []
-    for module in modules_to_patch:
-        p = patch(f"{module}.get_client", return_value=mock_garmin_client)
-        p.start()
-        patchers.append(p)
-
-    yield mock_garmin_client
-
-    for p in patchers:
-        p.stop()
+    originals = [module.get_client for module in _PATCH_TARGETS]
+
+    def _get_client(ctx):
+        return _session_garmin_client
+
+    for module in _PATCH_TARGETS:
+        module.get_client = _get_client
+
+    yield _session_garmin_client
+
+    for module, original in zip(_PATCH_TARGETS, originals):
+        module.get_client = original
 
 
 def create_test_app(module):
@@ -248,15 +291,23 @@ def create_test_app(module):
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app_factory():
     """
     Factory fixture to create FastMCP apps with different modules
 
+    Each module's app is built once per session: tools are stateless and
+    resolve get_client at call time, so the registered app can be reused.
+
     Usage:
         app = app_factory(health)
     """
+    apps = {}
+
     def _create_app(module):
-        return create_test_app(module)
+        app = apps.get(module.__name__)
+        if app is None:
+            app = apps[module.__name__] = create_test_app(module)
+        return app
 
     return _create_app
@@ -3,7 +3,7 @@ Integration tests for activities module MCP tools (v2 — 5 tools).
 
 Tests the thin tool wrappers via FastMCP call_tool with mocked Garmin client.
 """
-import json
+import orjson
 import pytest
 from mcp.server.fastmcp import FastMCP
 
@@ -12,7 +12,7 @@ from garmin_mcp import activities
 
 def _parse(result):
     """Extract JSON from call_tool result tuple: (content_list, is_error)."""
-    return json.loads(result[0][0].text)
+    return orjson.loads(result[0][0].text)
 
 
 SAMPLE_RAW = {
@@ -49,8 +49,8 @@ SAMPLE_RAW_FULL = {
 }
 
 
-@pytest.fixture
-def app(mock_garmin_client):
+@pytest.fixture(scope="module")
+def app():
     """Create FastMCP app with activities tools registered."""
     a = FastMCP("Test Activities")
     a = activities.register_tools(a)
@@ -60,7 +60,6 @@ def app(mock_garmin_client):
 # ── get_activities — date range mode ─────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_activities_by_date(app, mock_garmin_client):
     mock_garmin_client.get_activities_by_date.return_value = [SAMPLE_RAW]
 
@@ -81,7 +80,6 @@ async def test_get_activities_by_date(app, mock_garmin_client):
 # ── get_activities — pagination mode ─────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_activities_pagination(app, mock_garmin_client):
     mock_garmin_client.get_activities.return_value = [SAMPLE_RAW] * 5
 
@@ -92,20 +90,9 @@ async def test_get_activities_pagination(app, mock_garmin_client):
     mock_garmin_client.get_activities.assert_called_once_with(0, 5)
 
 
-@pytest.mark.asyncio
-async def test_get_activities_no_data(app, mock_garmin_client):
-    mock_garmin_client.get_activities.return_value = []
-
-    result = await app.call_tool("get_activities", {})
-    data = _parse(result)
-
-    assert "error" in data
-
-
 # ── get_activities — enriched fields (training effect, power, HR zones) ──────
 
 
-@pytest.mark.asyncio
 async def test_get_activities_training_fields(app, mock_garmin_client):
     """Training effect, power, HR zones, VO2max from list endpoint."""
     mock_garmin_client.get_activities_by_date.return_value = [SAMPLE_RAW_FULL]
@@ -134,7 +121,6 @@ async def test_get_activities_training_fields(app, mock_garmin_client):
     assert act["body_battery_impact"] == -8
 
 
-@pytest.mark.asyncio
 async def test_get_activities_hr_zones_zero_excluded(app, mock_garmin_client):
     """HR zones with value 0.0 should not appear in output."""
     raw = {**SAMPLE_RAW, "hrTimeInZone_1": 600.0, "hrTimeInZone_2": 0.0}
@@ -147,7 +133,6 @@ async def test_get_activities_hr_zones_zero_excluded(app, mock_garmin_client):
     assert zones == {"z1": 600}
 
 
-@pytest.mark.asyncio
 async def test_get_activities_no_hr_zones(app, mock_garmin_client):
     """Activities without HR zone data should not have hr_zones_seconds key."""
     mock_garmin_client.get_activities.return_value = [SAMPLE_RAW]
@@ -161,7 +146,6 @@ async def test_get_activities_no_hr_zones(app, mock_garmin_client):
 # ── get_activity — detail with RPE ──────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_activity_with_rpe(app, mock_garmin_client):
     """Detail endpoint includes perceived_effort and workout_feel."""
     mock_garmin_client.get_activity.return_value = {
@@ -192,7 +176,6 @@ async def test_get_activity_with_rpe(app, mock_garmin_client):
 # ── get_activity ──────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_activity(app, mock_garmin_client):
     mock_garmin_client.get_activity.return_value = {
         "activityId": 12345,
@@ -223,64 +206,57 @@ async def test_get_activity(app, mock_garmin_client):
     mock_garmin_client.get_activity.assert_called_once_with(12345)
 
 
-@pytest.mark.asyncio
-async def test_get_activity_no_data(app, mock_garmin_client):
-    mock_garmin_client.get_activity.return_value = None
-
-    result = await app.call_tool("get_activity", {"activity_id": 99999})
-    data = _parse(result)
-
-    assert "error" in data
-
-
-# ── get_activity_splits ───────────────────────────────────────────────────────
-
-
-@pytest.mark.asyncio
-async def test_get_activity_splits(app, mock_garmin_client):
-    mock_garmin_client.get_activity_splits.return_value = {
-        "activityId": 12345,
-        "lapDTOs": [
-            {
-                "lapIndex": 1,
-                "distance": 1000.0,
-                "duration": 300.0,
-                "averageSpeed": 3.33,
-                "averageHR": 145,
-                "maxHR": 155,
-            }
-        ],
-    }
-
-    result = await app.call_tool("get_activity_splits", {"activity_id": 12345})
-    data = _parse(result)
+# ── Per-activity tools: delegate by ID, error on empty ─────────────────────────
 
-    assert data["lap_count"] == 1
-    assert data["laps"][0]["lap_number"] == 1
-    mock_garmin_client.get_activity_splits.assert_called_once_with(12345)
+SAMPLE_SPLITS = {
+    "activityId": 12345,
+    "lapDTOs": [
+        {
+            "lapIndex": 1,
+            "distance": 1000.0,
+            "duration": 300.0,
+            "averageSpeed": 3.33,
+            "averageHR": 145,
+            "maxHR": 155,
+        }
+    ],
+}
 
+SAMPLE_HR_ZONES = [
+    {"zoneNumber": 1, "secsInZone": 600, "zoneLowBoundary": 100},
+    {"zoneNumber": 2, "secsInZone": 900, "zoneLowBoundary": 120},
+]
 
-# ── get_activity_hr_in_timezones ──────────────────────────────────────────────
+# (tool name == client method, mocked response, check on the parsed result)
+ACTIVITY_ID_TOOLS = [
+    pytest.param(
+        "get_activity_splits",
+        SAMPLE_SPLITS,
+        lambda data: data["lap_count"] == 1 and data["laps"][0]["lap_number"] == 1,
+        id="splits",
+    ),
+    pytest.param(
+        "get_activity_hr_in_timezones",
+        SAMPLE_HR_ZONES,
+        lambda data: data == SAMPLE_HR_ZONES,
+        id="hr_in_timezones",
+    ),
+]
 
 
-@pytest.mark.asyncio
-async def test_get_activity_hr_in_timezones(app, mock_garmin_client):
-    mock_garmin_client.get_activity_hr_in_timezones.return_value = [
-        {"zoneNumber": 1, "secsInZone": 600, "zoneLowBoundary": 100},
-        {"zoneNumber": 2, "secsInZone": 900, "zoneLowBoundary": 120},
-    ]
+@pytest.mark.parametrize("tool,payload,check", ACTIVITY_ID_TOOLS)
+async def test_activity_id_tool(app, mock_garmin_client, tool, payload, check):
+    getattr(mock_garmin_client, tool).return_value = payload
 
-    result = await app.call_tool("get_activity_hr_in_timezones", {"activity_id": 12345})
-    data = _parse(result)
+    result = await app.call_tool(tool, {"activity_id": 12345})
 
-    assert result is not None
-    mock_garmin_client.get_activity_hr_in_timezones.assert_called_once_with(12345)
+    assert check(_parse(result))
+    getattr(mock_garmin_client, tool).assert_called_once_with(12345)
 
 
 # ── get_activity_types ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_activity_types(app, mock_garmin_client):
     mock_garmin_client.get_activity_types.return_value = [
         {"typeId": 1, "typeKey": "running", "displayName": "Running", "parentTypeId": 17},
@@ -297,7 +273,6 @@ async def test_get_activity_types(app, mock_garmin_client):
 # ── include_hr_zones — enrichment skips inline zones ─────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_include_hr_zones_skips_inline(app, mock_garmin_client):
     """include_hr_zones=True should NOT overwrite activities that already have inline zones."""
     mock_garmin_client.get_activities_by_date.return_value = [SAMPLE_RAW_FULL]
@@ -320,7 +295,6 @@ async def test_include_hr_zones_skips_inline(app, mock_garmin_client):
     mock_garmin_client.get_activity_hr_in_timezones.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_include_hr_zones_enriches_missing(app, mock_garmin_client):
     """include_hr_zones=True should fetch zones for activities WITHOUT inline zones."""
     mock_garmin_client.get_activities_by_date.return_value = [SAMPLE_RAW]
@@ -343,7 +317,6 @@ async def test_include_hr_zones_enriches_missing(app, mock_garmin_client):
 # ── _first_not_none edge cases ───────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_training_effect_zero_preserved(app, mock_garmin_client):
     """training_effect=0.0 (falsy but valid) must be preserved, not replaced."""
     raw = {**SAMPLE_RAW, "aerobicTrainingEffect": 0.0}
@@ -355,7 +328,6 @@ async def test_training_effect_zero_preserved(app, mock_garmin_client):
     assert data["activities"][0]["training_effect"] == 0.0
 
 
-@pytest.mark.asyncio
 async def test_power_fallback_keys(app, mock_garmin_client):
     """avg_power_watts uses avgPower (list key), falls back to averagePower (detail key)."""
     # Only detail-style key
@@ -371,12 +343,28 @@ async def test_power_fallback_keys(app, mock_garmin_client):
 # ── exception handling ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_tool_exception_returns_json_error(app, mock_garmin_client):
-    mock_garmin_client.get_activities.side_effect = RuntimeError("Auth failed")
-
-    result = await app.call_tool("get_activities", {})
+@pytest.mark.parametrize(
+    "tool,kwargs,mock_attr,behavior",
+    [
+        ("get_activities", {}, "get_activities", "return_empty"),
+        ("get_activity", {"activity_id": 99999}, "get_activity", "return_none"),
+        ("get_activity_splits", {"activity_id": 99999}, "get_activity_splits", "return_none"),
+        ("get_activity_hr_in_timezones", {"activity_id": 99999}, "get_activity_hr_in_timezones", "return_none"),
+        ("get_activities", {}, "get_activities", "raise"),
+    ],
+)
+async def test_tool_error_returns_json_error(
+    app, mock_garmin_client, tool, kwargs, mock_attr, behavior
+):
+    method = getattr(mock_garmin_client, mock_attr)
+    if behavior == "raise":
+        method.side_effect = RuntimeError("Auth failed")
+    else:
+        method.return_value = [] if behavior == "return_empty" else None
+
+    result = await app.call_tool(tool, kwargs)
     data = _parse(result)
 
     assert "error" in data
-    assert "Auth failed" in data["error"]
+    if behavior == "raise":
+        assert "Auth failed" in data["error"]
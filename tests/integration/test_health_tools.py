@@ -3,7 +3,7 @@ Integration tests for health module MCP tools (v2 — 9 tools).
 
 Tests the thin tool wrappers via FastMCP call_tool with mocked Garmin client.
 """
-import json
+import orjson
 import pytest
 from mcp.server.fastmcp import FastMCP
 
@@ -12,11 +12,11 @@ from garmin_mcp import health
 
 def _parse(result):
     """Extract JSON from call_tool result tuple: (content_list, is_error)."""
-    return json.loads(result[0][0].text)
+    return orjson.loads(result[0][0].text)
 
 
-@pytest.fixture
-def app(mock_garmin_client):
+@pytest.fixture(scope="module")
+def app():
     """Create FastMCP app with health tools registered."""
     a = FastMCP("Test Health")
     a = health.register_tools(a)
@@ -26,7 +26,6 @@ def app(mock_garmin_client):
 # ── get_coaching_snapshot ─────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_coaching_snapshot(app, mock_garmin_client):
     mock_garmin_client.get_coaching_snapshot.return_value = {
         "date": "2024-01-15",
@@ -58,7 +57,6 @@ async def test_get_coaching_snapshot(app, mock_garmin_client):
 # ── get_stats ─────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_stats(app, mock_garmin_client):
     mock_garmin_client.get_user_summary.return_value = {
         "calendarDate": "2024-01-15",
@@ -77,20 +75,9 @@ async def test_get_stats(app, mock_garmin_client):
     mock_garmin_client.get_user_summary.assert_called_once_with("2024-01-15")
 
 
-@pytest.mark.asyncio
-async def test_get_stats_no_data(app, mock_garmin_client):
-    mock_garmin_client.get_user_summary.return_value = None
-
-    result = await app.call_tool("get_stats", {"date": "2024-01-15"})
-    data = _parse(result)
-
-    assert "error" in data
-
-
 # ── get_sleep ─────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_sleep(app, mock_garmin_client):
     mock_garmin_client.get_sleep_data.return_value = {
         "dailySleepDTO": {
@@ -116,20 +103,9 @@ async def test_get_sleep(app, mock_garmin_client):
     mock_garmin_client.get_sleep_data.assert_called_once_with("2024-01-15")
 
 
-@pytest.mark.asyncio
-async def test_get_sleep_no_data(app, mock_garmin_client):
-    mock_garmin_client.get_sleep_data.return_value = None
-
-    result = await app.call_tool("get_sleep", {"date": "2024-01-15"})
-    data = _parse(result)
-
-    assert "error" in data
-
-
 # ── get_stress ────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_stress(app, mock_garmin_client):
     mock_garmin_client.get_stress_data.return_value = {
         "calendarDate": "2024-01-15",
@@ -145,51 +121,73 @@ async def test_get_stress(app, mock_garmin_client):
     mock_garmin_client.get_stress_data.assert_called_once_with("2024-01-15")
 
 
-# ── get_heart_rate ────────────────────────────────────────────────────────────
-
-
-@pytest.mark.asyncio
-async def test_get_heart_rate(app, mock_garmin_client):
-    mock_garmin_client.get_heart_rates.return_value = {
-        "calendarDate": "2024-01-15",
-        "maxHeartRate": 180,
-        "minHeartRate": 45,
-        "restingHeartRate": 55,
-        "lastSevenDaysAvgRestingHeartRate": 57,
-        "heartRateValues": [[1, 60], [2, 70]],
-    }
-
-    result = await app.call_tool("get_heart_rate", {"date": "2024-01-15"})
-    data = _parse(result)
-
-    assert data["resting_heart_rate_bpm"] == 55
-    mock_garmin_client.get_heart_rates.assert_called_once_with("2024-01-15")
-
-
-# ── get_respiration ───────────────────────────────────────────────────────────
+# ── single-day metric tools ───────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_get_respiration(app, mock_garmin_client):
-    mock_garmin_client.get_respiration_data.return_value = {
-        "calendarDate": "2024-01-15",
-        "lowestRespirationValue": 12,
-        "highestRespirationValue": 22,
-        "avgWakingRespirationValue": 16,
-        "avgSleepRespirationValue": 14,
-    }
-
-    result = await app.call_tool("get_respiration", {"date": "2024-01-15"})
+DAILY_METRIC_TOOLS = [
+    pytest.param(
+        "get_heart_rate",
+        "get_heart_rates",
+        {
+            "calendarDate": "2024-01-15",
+            "maxHeartRate": 180,
+            "minHeartRate": 45,
+            "restingHeartRate": 55,
+            "lastSevenDaysAvgRestingHeartRate": 57,
+            "heartRateValues": [[1, 60], [2, 70]],
+        },
+        "resting_heart_rate_bpm",
+        55,
+        id="heart_rate",
+    ),
+    pytest.param(
+        "get_respiration",
+        "get_respiration_data",
+        {
+            "calendarDate": "2024-01-15",
+            "lowestRespirationValue": 12,
+            "highestRespirationValue": 22,
+            "avgWakingRespirationValue": 16,
+            "avgSleepRespirationValue": 14,
+        },
+        "lowest_breaths_per_min",
+        12,
+        id="respiration",
+    ),
+    pytest.param(
+        "get_spo2_data",
+        "get_spo2_data",
+        {
+            "calendarDate": "2024-01-15",
+            "averageSpO2": 96,
+            "lowestSpO2": 93,
+            "latestSpO2": 97,
+        },
+        "avg_spo2_percent",
+        96,
+        id="spo2",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "tool_name,mock_attr,mock_value,assert_key,assert_value", DAILY_METRIC_TOOLS
+)
+async def test_daily_metric_tool(
+    app, mock_garmin_client, tool_name, mock_attr, mock_value, assert_key, assert_value
+):
+    getattr(mock_garmin_client, mock_attr).return_value = mock_value
+
+    result = await app.call_tool(tool_name, {"date": "2024-01-15"})
     data = _parse(result)
 
-    assert data["lowest_breaths_per_min"] == 12
-    mock_garmin_client.get_respiration_data.assert_called_once_with("2024-01-15")
+    assert data[assert_key] == assert_value
+    getattr(mock_garmin_client, mock_attr).assert_called_once_with("2024-01-15")
 
 
 # ── get_body_battery ──────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_body_battery(app, mock_garmin_client):
     mock_garmin_client.get_body_battery.return_value = [
         {"date": "2024-01-15", "charged": 50, "drained": 30}
@@ -204,29 +202,9 @@ async def test_get_body_battery(app, mock_garmin_client):
     mock_garmin_client.get_body_battery.assert_called_once()
 
 
-# ── get_spo2_data ─────────────────────────────────────────────────────────────
-
-
-@pytest.mark.asyncio
-async def test_get_spo2_data(app, mock_garmin_client):
-    mock_garmin_client.get_spo2_data.return_value = {
-        "calendarDate": "2024-01-15",
-        "averageSpO2": 96,
-        "lowestSpO2": 93,
-        "latestSpO2": 97,
-    }
-
-    result = await app.call_tool("get_spo2_data", {"date": "2024-01-15"})
-    data = _parse(result)
-
-    assert data["avg_spo2_percent"] == 96
-    mock_garmin_client.get_spo2_data.assert_called_once_with("2024-01-15")
-
-
 # ── get_training_readiness ────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_training_readiness(app, mock_garmin_client):
     mock_garmin_client.get_training_readiness.return_value = [
         {
@@ -249,12 +227,26 @@ async def test_get_training_readiness(app, mock_garmin_client):
 # ── exception handling ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_tool_exception_returns_json_error(app, mock_garmin_client):
-    mock_garmin_client.get_user_summary.side_effect = RuntimeError("Connection failed")
-
-    result = await app.call_tool("get_stats", {"date": "2024-01-15"})
+@pytest.mark.parametrize(
+    "tool,kwargs,mock_attr,behavior",
+    [
+        ("get_stats", {"date": "2024-01-15"}, "get_user_summary", "return_none"),
+        ("get_sleep", {"date": "2024-01-15"}, "get_sleep_data", "return_none"),
+        ("get_stats", {"date": "2024-01-15"}, "get_user_summary", "raise"),
+    ],
+)
+async def test_tool_error_returns_json_error(
+    app, mock_garmin_client, tool, kwargs, mock_attr, behavior
+):
+    method = getattr(mock_garmin_client, mock_attr)
+    if behavior == "raise":
+        method.side_effect = RuntimeError("Connection failed")
+    else:
+        method.return_value = None
+
+    result = await app.call_tool(tool, kwargs)
     data = _parse(result)
 
     assert "error" in data
-    assert "Connection failed" in data["error"]
+    if behavior == "raise":
+        assert "Connection failed" in data["error"]
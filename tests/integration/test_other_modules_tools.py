@@ -6,7 +6,7 @@ Tests tools from:
 - gear (3 tools: get_gear, add_gear_to_activity, remove_gear_from_activity)
 Total: 6 tools
 """
-import json
+import orjson
 import pytest
 from mcp.server.fastmcp import FastMCP
 
@@ -22,20 +22,19 @@ from tests.fixtures.garmin_responses import (
 
 def _parse(result):
     """Extract JSON from call_tool result."""
-    return json.loads(result[0][0].text)
+    return orjson.loads(result[0][0].text)
 
 
 # ── Body Data ────────────────────────────────────────────────────────────────
 
 
-@pytest.fixture
-def app_with_body_data(mock_garmin_client):
+@pytest.fixture(scope="module")
+def app_with_body_data():
     app = FastMCP("Test Body Data")
     app = body_data.register_tools(app)
     return app
 
 
-@pytest.mark.asyncio
 async def test_get_weigh_ins_tool(app_with_body_data, mock_garmin_client):
     mock_garmin_client.get_weigh_ins.return_value = MOCK_WEIGH_INS
     result = await app_with_body_data.call_tool(
@@ -46,7 +45,6 @@ async def test_get_weigh_ins_tool(app_with_body_data, mock_garmin_client):
     mock_garmin_client.get_weigh_ins.assert_called_once_with("2024-01-08", "2024-01-15")
 
 
-@pytest.mark.asyncio
 async def test_get_weigh_ins_no_data(app_with_body_data, mock_garmin_client):
     mock_garmin_client.get_weigh_ins.return_value = None
     result = await app_with_body_data.call_tool(
@@ -56,7 +54,6 @@ async def test_get_weigh_ins_no_data(app_with_body_data, mock_garmin_client):
     assert "error" in data
 
 
-@pytest.mark.asyncio
 async def test_add_weigh_in_tool(app_with_body_data, mock_garmin_client):
     mock_garmin_client.add_weigh_in.return_value = {}
     result = await app_with_body_data.call_tool(
@@ -67,7 +64,6 @@ async def test_add_weigh_in_tool(app_with_body_data, mock_garmin_client):
     mock_garmin_client.add_weigh_in.assert_called_once_with(weight=70.5, unitKey="kg")
 
 
-@pytest.mark.asyncio
 async def test_add_weigh_in_with_timestamps(app_with_body_data, mock_garmin_client):
     mock_garmin_client.add_weigh_in_with_timestamps.return_value = {}
     result = await app_with_body_data.call_tool(
@@ -81,7 +77,6 @@ async def test_add_weigh_in_with_timestamps(app_with_body_data, mock_garmin_clie
     mock_garmin_client.add_weigh_in_with_timestamps.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_delete_weigh_ins_tool(app_with_body_data, mock_garmin_client):
     mock_garmin_client.delete_weigh_ins.return_value = {}
     result = await app_with_body_data.call_tool(
@@ -95,14 +90,13 @@ async def test_delete_weigh_ins_tool(app_with_body_data, mock_garmin_client):
 # ── Gear ─────────────────────────────────────────────────────────────────────
 
 
-@pytest.fixture
-def app_with_gear(mock_garmin_client):
+@pytest.fixture(scope="module")
+def app_with_gear():
     app = FastMCP("Test Gear")
     app = gear.register_tools(app)
     return app
 
 
-@pytest.mark.asyncio
 async def test_get_gear_tool(app_with_gear, mock_garmin_client):
     mock_garmin_client.get_gear.return_value = MOCK_GEAR
     result = await app_with_gear.call_tool("get_gear", {"user_profile_id": "abc123456"})
@@ -111,7 +105,6 @@ async def test_get_gear_tool(app_with_gear, mock_garmin_client):
     mock_garmin_client.get_gear.assert_called_once_with("abc123456")
 
 
-@pytest.mark.asyncio
 async def test_get_gear_no_data(app_with_gear, mock_garmin_client):
     mock_garmin_client.get_gear.return_value = None
     result = await app_with_gear.call_tool("get_gear", {"user_profile_id": "abc123456"})
@@ -119,7 +112,6 @@ async def test_get_gear_no_data(app_with_gear, mock_garmin_client):
     assert "error" in data
 
 
-@pytest.mark.asyncio
 async def test_add_gear_to_activity_tool(app_with_gear, mock_garmin_client):
     mock_garmin_client.add_gear_to_activity.return_value = {}
     result = await app_with_gear.call_tool(
@@ -130,7 +122,6 @@ async def test_add_gear_to_activity_tool(app_with_gear, mock_garmin_client):
     mock_garmin_client.add_gear_to_activity.assert_called_once_with("abc123", 12345678901)
 
 
-@pytest.mark.asyncio
 async def test_remove_gear_from_activity_tool(app_with_gear, mock_garmin_client):
     mock_garmin_client.remove_gear_from_activity.return_value = {}
     result = await app_with_gear.call_tool(
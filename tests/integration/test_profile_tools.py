@@ -3,7 +3,7 @@ Integration tests for profile module MCP tools (v2 — 4 tools).
 
 Tests the thin tool wrappers via FastMCP call_tool with mocked Garmin client.
 """
-import json
+import orjson
 import pytest
 from mcp.server.fastmcp import FastMCP
 
@@ -12,18 +12,17 @@ from garmin_mcp import profile
 
 def _parse(result):
     """Extract JSON from call_tool result tuple: (content_list, is_error)."""
-    return json.loads(result[0][0].text)
+    return orjson.loads(result[0][0].text)
 
 
-@pytest.fixture
-def app(mock_garmin_client):
+@pytest.fixture(scope="module")
+def app():
     """Create FastMCP app with profile tools registered."""
     a = FastMCP("Test Profile")
     a = profile.register_tools(a)
     return a
 
 
-@pytest.mark.asyncio
 async def test_get_full_name(app, mock_garmin_client):
     mock_garmin_client.get_full_name.return_value = "Jean Dupont"
 
@@ -33,7 +32,6 @@ async def test_get_full_name(app, mock_garmin_client):
     assert text == "Jean Dupont"
 
 
-@pytest.mark.asyncio
 async def test_get_user_profile(app, mock_garmin_client):
     mock_garmin_client.get_user_profile.return_value = {
         "displayName": "Jean Dupont",
@@ -51,7 +49,6 @@ async def test_get_user_profile(app, mock_garmin_client):
     assert data["unit_system"] == "metric"
 
 
-@pytest.mark.asyncio
 async def test_get_user_profile_no_data(app, mock_garmin_client):
     mock_garmin_client.get_user_profile.return_value = None
 
@@ -61,7 +58,6 @@ async def test_get_user_profile_no_data(app, mock_garmin_client):
     assert "error" in data
 
 
-@pytest.mark.asyncio
 async def test_get_devices(app, mock_garmin_client):
     mock_garmin_client.get_devices.return_value = [
         {"deviceId": 1, "displayName": "Forerunner 965", "deviceStatusName": "ACTIVE"},
@@ -76,7 +72,6 @@ async def test_get_devices(app, mock_garmin_client):
     assert data["devices"][0]["is_last_used"] is True
 
 
-@pytest.mark.asyncio
 async def test_get_devices_no_data(app, mock_garmin_client):
     mock_garmin_client.get_devices.return_value = None
 
@@ -89,7 +84,6 @@ async def test_get_devices_no_data(app, mock_garmin_client):
 # ── get_device_capabilities ──────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_device_capabilities(app, mock_garmin_client):
     mock_garmin_client.get_usage_indicators.return_value = {
         "deviceBasedIndicators": {
@@ -107,7 +101,6 @@ async def test_get_device_capabilities(app, mock_garmin_client):
     assert data["capabilities"]["hasHrvStatusCapableDevice"] is True
 
 
-@pytest.mark.asyncio
 async def test_get_device_capabilities_api_failure(app, mock_garmin_client):
     mock_garmin_client.get_usage_indicators.side_effect = Exception("Network error")
 
@@ -3,7 +3,7 @@ Integration tests for training module MCP tools (7 tools).
 
 Tests the thin tool wrappers via FastMCP call_tool with mocked Garmin client.
 """
-import json
+import orjson
 import pytest
 from mcp.server.fastmcp import FastMCP
 
@@ -12,11 +12,11 @@ from garmin_mcp import training
 
 def _parse(result):
     """Extract JSON from call_tool result tuple: (content_list, is_error)."""
-    return json.loads(result[0][0].text)
+    return orjson.loads(result[0][0].text)
 
 
-@pytest.fixture
-def app(mock_garmin_client):
+@pytest.fixture(scope="module")
+def app():
     """Create FastMCP app with training tools registered."""
     a = FastMCP("Test Training")
     a = training.register_tools(a)
@@ -26,7 +26,6 @@ def app(mock_garmin_client):
 # ── get_max_metrics ───────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_max_metrics(app, mock_garmin_client):
     mock_garmin_client.get_max_metrics.return_value = {
         "metricType": "RUNNING",
@@ -44,20 +43,9 @@ async def test_get_max_metrics(app, mock_garmin_client):
     mock_garmin_client.get_max_metrics.assert_called_once_with("2024-01-15")
 
 
-@pytest.mark.asyncio
-async def test_get_max_metrics_no_data(app, mock_garmin_client):
-    mock_garmin_client.get_max_metrics.return_value = None
-
-    result = await app.call_tool("get_max_metrics", {"date": "2024-01-15"})
-    data = _parse(result)
-
-    assert "error" in data
-
-
 # ── get_hrv_data ──────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_hrv_data(app, mock_garmin_client):
     mock_garmin_client.get_hrv_data.return_value = {
         "hrvSummary": {
@@ -81,7 +69,6 @@ async def test_get_hrv_data(app, mock_garmin_client):
 # ── get_training_status ───────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_training_status(app, mock_garmin_client):
     mock_garmin_client.get_training_status.return_value = {
         "mostRecentTrainingStatus": {
@@ -123,7 +110,6 @@ async def test_get_training_status(app, mock_garmin_client):
 # ── get_progress_summary ──────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_progress_summary(app, mock_garmin_client):
     mock_garmin_client.get_progress_summary_between_dates.return_value = [
         {
@@ -159,7 +145,6 @@ async def test_get_progress_summary(app, mock_garmin_client):
 # ── get_race_predictions ──────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_race_predictions(app, mock_garmin_client):
     mock_garmin_client.get_race_predictions.return_value = {"5K": "22:00", "10K": "46:00"}
 
@@ -170,44 +155,26 @@ async def test_get_race_predictions(app, mock_garmin_client):
     mock_garmin_client.get_race_predictions.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_get_race_predictions_no_data(app, mock_garmin_client):
-    mock_garmin_client.get_race_predictions.return_value = None
-
-    result = await app.call_tool("get_race_predictions", {})
-    data = _parse(result)
-
-    assert "error" in data
-
-
 # ── get_goals ─────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_get_goals(app, mock_garmin_client):
+@pytest.mark.parametrize(
+    "payload,expected",
+    [({"goal_type": "active"}, "active"), ({}, "active"), ({"goal_type": "future"}, "future")],
+)
+async def test_get_goals(app, mock_garmin_client, payload, expected):
     mock_garmin_client.get_goals.return_value = [{"goalType": "steps", "target": 10000}]
 
-    result = await app.call_tool("get_goals", {"goal_type": "active"})
+    result = await app.call_tool("get_goals", payload)
     data = _parse(result)
 
     assert isinstance(data, list)
-    mock_garmin_client.get_goals.assert_called_once_with("active")
-
-
-@pytest.mark.asyncio
-async def test_get_goals_no_data(app, mock_garmin_client):
-    mock_garmin_client.get_goals.return_value = None
-
-    result = await app.call_tool("get_goals", {})
-    data = _parse(result)
-
-    assert "error" in data
+    mock_garmin_client.get_goals.assert_called_once_with(expected)
 
 
 # ── get_personal_record ───────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_personal_record(app, mock_garmin_client):
     mock_garmin_client.get_personal_record.return_value = [{"recordType": "FASTEST_5K"}]
 
@@ -221,12 +188,27 @@ async def test_get_personal_record(app, mock_garmin_client):
 # ── exception handling ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_tool_exception_returns_json_error(app, mock_garmin_client):
-    mock_garmin_client.get_max_metrics.side_effect = RuntimeError("Timeout")
-
-    result = await app.call_tool("get_max_metrics", {"date": "2024-01-15"})
+@pytest.mark.parametrize(
+    "tool,kwargs,mock_attr,behavior",
+    [
+        ("get_max_metrics", {"date": "2024-01-15"}, "get_max_metrics", "return_none"),
+        ("get_race_predictions", {}, "get_race_predictions", "return_none"),
+        ("get_goals", {}, "get_goals", "return_none"),
+        ("get_max_metrics", {"date": "2024-01-15"}, "get_max_metrics", "raise"),
+    ],
+)
+async def test_tool_error_returns_json_error(
+    app, mock_garmin_client, tool, kwargs, mock_attr, behavior
+):
+    method = getattr(mock_garmin_client, mock_attr)
+    if behavior == "raise":
+        method.side_effect = RuntimeError("Timeout")
+    else:
+        method.return_value = None
+
+    result = await app.call_tool(tool, kwargs)
     data = _parse(result)
 
     assert "error" in data
-    assert "Timeout" in data["error"]
+    if behavior == "raise":
+        assert "Timeout" in data["error"]
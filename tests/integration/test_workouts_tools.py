@@ -1,9 +1,9 @@
 """
-Integration tests for workouts module MCP tools (9 tools).
+Integration tests for workouts module MCP tools (10 tools).
 
 Tests the thin tool wrappers via FastMCP call_tool with mocked Garmin client.
 """
-import json
+import orjson
 import pytest
 from mcp.server.fastmcp import FastMCP
 
@@ -12,11 +12,11 @@ from garmin_mcp import workouts
 
 def _parse(result):
     """Extract JSON from call_tool result tuple: (content_list, is_error)."""
-    return json.loads(result[0][0].text)
+    return orjson.loads(result[0][0].text)
 
 
-@pytest.fixture
-def app(mock_garmin_client):
+@pytest.fixture(scope="module")
+def app():
     """Create FastMCP app with workout tools registered."""
     a = FastMCP("Test Workouts")
     a = workouts.register_tools(a)
@@ -26,7 +26,6 @@ def app(mock_garmin_client):
 # ── get_workouts ──────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_workouts(app, mock_garmin_client):
     mock_garmin_client.get_workouts.return_value = [
         {"workoutId": 1, "workoutName": "Easy Run", "sportType": {"sportTypeKey": "running"}},
@@ -39,20 +38,9 @@ async def test_get_workouts(app, mock_garmin_client):
     assert data["workouts"][0]["id"] == 1
 
 
-@pytest.mark.asyncio
-async def test_get_workouts_no_data(app, mock_garmin_client):
-    mock_garmin_client.get_workouts.return_value = None
-
-    result = await app.call_tool("get_workouts", {})
-    data = _parse(result)
-
-    assert "error" in data
-
-
 # ── get_workout_by_id ─────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_workout_by_id(app, mock_garmin_client):
     mock_garmin_client.get_workout_by_id.return_value = {
         "workoutId": 1,
@@ -67,10 +55,25 @@ async def test_get_workout_by_id(app, mock_garmin_client):
     assert data["sport"] == "running"
 
 
+# ── get_workouts_by_ids ───────────────────────────────────────────────────────
+
+
+async def test_get_workouts_by_ids(app, mock_garmin_client):
+    mock_garmin_client.get_workout_by_id.side_effect = lambda wid: {
+        "workoutId": wid,
+        "sportType": {"sportTypeKey": "running"},
+    }
+
+    result = await app.call_tool("get_workouts_by_ids", {"workout_ids": [1, 2]})
+    data = _parse(result)
+
+    assert data["count"] == 2
+    assert [w["id"] for w in data["workouts"]] == [1, 2]
+
+
 # ── create_workout ────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_create_workout_without_date(app, mock_garmin_client):
     mock_garmin_client.upload_workout.return_value = {"workoutId": 42, "workoutName": "Test"}
 
@@ -88,7 +91,6 @@ async def test_create_workout_without_date(app, mock_garmin_client):
     mock_garmin_client.schedule_workout.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_create_workout_with_date(app, mock_garmin_client):
     mock_garmin_client.upload_workout.return_value = {"workoutId": 42, "workoutName": "Test"}
     mock_garmin_client.schedule_workout.return_value = {"workoutScheduleId": 99}
@@ -110,7 +112,6 @@ async def test_create_workout_with_date(app, mock_garmin_client):
 # ── delete_workout ────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_delete_workout(app, mock_garmin_client):
     mock_garmin_client.get_scheduled_workouts_for_range.return_value = []
     mock_garmin_client.delete_workout.return_value = True
@@ -124,7 +125,6 @@ async def test_delete_workout(app, mock_garmin_client):
 # ── schedule_workout ──────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_schedule_workout(app, mock_garmin_client):
     mock_garmin_client.schedule_workout.return_value = {"workoutScheduleId": 99}
 
@@ -141,7 +141,6 @@ async def test_schedule_workout(app, mock_garmin_client):
 # ── unschedule_workout ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_unschedule_workout(app, mock_garmin_client):
     mock_garmin_client.unschedule_workout.return_value = True
 
@@ -154,7 +153,6 @@ async def test_unschedule_workout(app, mock_garmin_client):
 # ── reschedule_workout ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_reschedule_workout(app, mock_garmin_client):
     mock_garmin_client.get_scheduled_workouts_for_range.return_value = [
         {"scheduledWorkoutId": 99, "workoutId": 42, "workoutName": "Tempo"}
@@ -173,12 +171,25 @@ async def test_reschedule_workout(app, mock_garmin_client):
 # ── exception handling ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_tool_exception_returns_json_error(app, mock_garmin_client):
-    mock_garmin_client.get_workouts.side_effect = RuntimeError("Auth expired")
-
-    result = await app.call_tool("get_workouts", {})
+@pytest.mark.parametrize(
+    "tool,kwargs,mock_attr,behavior",
+    [
+        ("get_workouts", {}, "get_workouts", "return_none"),
+        ("get_workouts", {}, "get_workouts", "raise"),
+    ],
+)
+async def test_tool_error_returns_json_error(
+    app, mock_garmin_client, tool, kwargs, mock_attr, behavior
+):
+    method = getattr(mock_garmin_client, mock_attr)
+    if behavior == "raise":
+        method.side_effect = RuntimeError("Auth expired")
+    else:
+        method.return_value = None
+
+    result = await app.call_tool(tool, kwargs)
     data = _parse(result)
 
     assert "error" in data
-    assert "Auth expired" in data["error"]
+    if behavior == "raise":
+        assert "Auth expired" in data["error"]
@@ -118,6 +118,14 @@ class TestGraphQLEnrichment:
         assert result["count"] == 1
         assert "training_load" not in result["activities"][0]
 
+    def test_malformed_dates_never_reach_query(self, client):
+        """Dates are interpolated into the query text, so reject non-ISO input."""
+        client.display_name = "test-user"
+        activities = [{"id": 12345}]
+        api._maybe_enrich_graphql(client, activities, '2024-01-01") {x', "2024-01-15", None)
+        client.query_garmin_graphql.assert_not_called()
+        assert activities == [{"id": 12345}]
+
     def test_pagination_mode_enriches(self, client):
         """Pagination mode also enriches via GraphQL."""
         client.get_activities.return_value = [SAMPLE_RAW_ACTIVITY]
@@ -134,6 +142,21 @@ class TestGraphQLEnrichment:
         result = api.get_activities(client, start=0, limit=5)
         assert result["activities"][0]["training_load"] == 88.0
 
+    def test_pagination_mode_queries_date_span(self, client):
+        """The GraphQL window spans the earliest to latest activity day."""
+        client.display_name = "test-user"
+        client.query_garmin_graphql.return_value = {"data": {}}
+        activities = [
+            {"id": 1, "start_time": "2024-01-10 07:00:00"},
+            {"id": 2},
+            {"id": 3, "start_time": "2024-01-03 18:30:00"},
+            {"id": 4, "start_time": "2024-01-15 06:00:00"},
+        ]
+        api._maybe_enrich_graphql_from_activities(client, activities, None)
+        query = client.query_garmin_graphql.call_args[0][0]["query"]
+        assert 'startTimestampLocal:"2024-01-03T' in query
+        assert 'endTimestampLocal:"2024-01-15T' in query
+
 
 class TestGetActivity:
     def test_curates_detail(self, client):
@@ -167,6 +190,17 @@ class TestGetActivity:
         client.get_activity.return_value = None
         result = api.get_activity(client, 99999)
         assert "error" in result
+        client.get_activity_weather.assert_not_called()
+
+    def test_weather_failure_is_ignored(self, client):
+        client.get_activity.return_value = {
+            "activityId": 12345,
+            "summaryDTO": {"duration": 3000.0},
+        }
+        client.get_activity_weather.side_effect = Exception("boom")
+        result = api.get_activity(client, 12345)
+        assert result["id"] == 12345
+        assert "weather" not in result
 
 
 class TestGetActivitySplits:
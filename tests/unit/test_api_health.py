@@ -95,8 +95,19 @@ class TestGetStress:
         }
         result = api.get_stress(client, "2024-01-15")
         assert result["max_stress_level"] == 80
-        assert "rest_percent" in result
-        assert "high_stress_percent" in result
+        assert result["rest_percent"] == 40.0
+        assert result["low_stress_percent"] == 40.0
+        assert result["medium_stress_percent"] == 0.0
+        assert result["high_stress_percent"] == 20.0
+
+    def test_ignores_unmeasured_readings(self, client):
+        client.get_stress_data.return_value = {
+            "calendarDate": "2024-01-15",
+            "stressValuesArray": [[1, -1], [2, None], [3, 0], [4, 10]],
+        }
+        result = api.get_stress(client, "2024-01-15")
+        assert result["rest_percent"] == 100.0
+        assert result["high_stress_percent"] == 0.0
 
     def test_no_data(self, client):
         client.get_stress_data.return_value = None
@@ -127,11 +127,37 @@ class TestGetWorkouts:
         assert result["workouts"][0]["id"] == 1
         assert result["workouts"][0]["sport"] == "running"
 
+    @pytest.mark.parametrize("sport_type", [{}, None, "running"], ids=["empty", "missing", "scalar"])
+    def test_unusable_sport_type_dropped(self, client, sport_type):
+        client.get_workouts.return_value = [{"workoutId": 1, "sportType": sport_type}]
+        result = api.get_workouts(client)
+        assert result["workouts"][0] == {"id": 1}
+
     def test_no_data(self, client):
         client.get_workouts.return_value = None
         result = api.get_workouts(client)
         assert "error" in result
 
+    def test_paginates(self, client):
+        client.get_workouts.return_value = [
+            {"workoutId": i, "workoutName": f"W{i}"} for i in range(5)
+        ]
+        result = api.get_workouts(client, start=1, limit=2)
+        assert result["total"] == 5
+        assert result["count"] == 2
+        assert [w["id"] for w in result["workouts"]] == [1, 2]
+        assert result["has_more"] is True
+        assert result["next_start"] == 3
+
+    def test_last_page(self, client):
+        client.get_workouts.return_value = [
+            {"workoutId": i, "workoutName": f"W{i}"} for i in range(5)
+        ]
+        result = api.get_workouts(client, start=4, limit=2)
+        assert result["count"] == 1
+        assert result["has_more"] is False
+        assert result["next_start"] is None
+
 
 class TestCreateWorkout:
     def test_create_only(self, client):
@@ -147,6 +173,9 @@ class TestCreateWorkout:
         assert result["workout_id"] == 42
         client.upload_workout.assert_called_once()
         client.schedule_workout.assert_not_called()
+        payload = client.upload_workout.call_args[0][0]
+        assert isinstance(payload, dict)
+        assert "workoutSegments" in payload
 
     def test_create_and_schedule(self, client):
         client.upload_workout.return_value = {"workoutId": 42, "workoutName": "Test"}
@@ -178,6 +207,77 @@ class TestCreateWorkout:
         assert "schedule_error" in result
 
 
+class TestGetWorkoutById:
+    def test_curates_details(self, client):
+        client.get_workout_by_id.return_value = {
+            "workoutId": 7,
+            "workoutName": "Intervals",
+            "sportType": {"sportTypeKey": "running"},
+            "description": None,
+            "avgTrainingSpeed": 3.1,
+            "workoutSegments": [{"segmentOrder": 1, "workoutSteps": [{"stepId": 1, "zoneNumber": None}]}],
+        }
+        result = api.get_workout_by_id(client, 7)
+        assert result == {
+            "id": 7,
+            "name": "Intervals",
+            "sport": "running",
+            "avg_training_speed_mps": 3.1,
+            "segments": [{"segmentOrder": 1, "workoutSteps": [{"stepId": 1}]}],
+        }
+
+    def test_empty_segments_omitted(self, client):
+        client.get_workout_by_id.return_value = {"workoutId": 7, "workoutSegments": []}
+        assert api.get_workout_by_id(client, 7) == {"id": 7}
+
+    def test_not_found(self, client):
+        client.get_workout_by_id.return_value = None
+        assert "error" in api.get_workout_by_id(client, 7)
+
+
+class TestGetWorkoutsByIds:
+    def test_keeps_request_order(self, client):
+        client.get_workout_by_id.side_effect = lambda wid: {"workoutId": wid, "workoutName": f"W{wid}"}
+        result = api.get_workouts_by_ids(client, [3, 1, 2])
+        assert result["count"] == 3
+        assert [w["id"] for w in result["workouts"]] == [3, 1, 2]
+
+    def test_duplicates_fetched_once(self, client):
+        client.get_workout_by_id.return_value = {"workoutId": 1}
+        result = api.get_workouts_by_ids(client, [1, 1])
+        assert result["count"] == 1
+        client.get_workout_by_id.assert_called_once_with(1)
+
+    def test_per_id_failures_dont_fail_batch(self, client):
+        def lookup(wid):
+            if wid == 2:
+                raise RuntimeError("boom")
+            if wid == 3:
+                return None
+            return {"workoutId": wid}
+
+        client.get_workout_by_id.side_effect = lookup
+        result = api.get_workouts_by_ids(client, [1, 2, 3])
+        assert result["workouts"][0] == {"id": 1}
+        assert result["workouts"][1] == {"id": 2, "error": "boom"}
+        assert result["workouts"][2]["id"] == 3
+        assert "error" in result["workouts"][2]
+
+    def test_empty(self, client):
+        assert "error" in api.get_workouts_by_ids(client, [])
+        client.get_workout_by_id.assert_not_called()
+
+    def test_too_many_ids_rejected(self, client):
+        ids = list(range(api._MAX_WORKOUTS_PER_CALL + 1))
+        assert "error" in api.get_workouts_by_ids(client, ids)
+        client.get_workout_by_id.assert_not_called()
+
+    def test_limit_counts_unique_ids(self, client):
+        client.get_workout_by_id.side_effect = lambda wid: {"workoutId": wid}
+        ids = list(range(api._MAX_WORKOUTS_PER_CALL)) * 2
+        assert api.get_workouts_by_ids(client, ids)["count"] == api._MAX_WORKOUTS_PER_CALL
+
+
 class TestDeleteWorkout:
     def test_success(self, client):
         client.get_scheduled_workouts_for_range.return_value = []
@@ -242,3 +342,86 @@ class TestRescheduleWorkout:
         assert result["new_schedule_id"] == 100
         client.unschedule_workout.assert_called_once_with(99)
         client.schedule_workout.assert_called_once_with(42, "2024-01-25")
+
+
+class TestWorkoutReadCache:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        api._cache.clear()
+        yield
+        api._cache.clear()
+
+    @pytest.fixture
+    def user_client(self):
+        c = Mock()
+        c.display_name = "athlete"
+        c.garth.oauth2_token.access_token = "token-athlete"
+        c.get_workout_by_id.return_value = {"workoutId": 1, "workoutName": "Easy Run"}
+        return c
+
+    def test_repeat_lookup_served_from_cache(self, user_client):
+        first = api.get_workout_by_id(user_client, 1)
+        second = api.get_workout_by_id(user_client, 1)
+        assert first == second == {"id": 1, "name": "Easy Run"}
+        user_client.get_workout_by_id.assert_called_once_with(1)
+
+    def test_cached_result_is_a_copy(self, user_client):
+        api.get_workout_by_id(user_client, 1)["name"] = "mutated"
+        assert api.get_workout_by_id(user_client, 1)["name"] == "Easy Run"
+
+    def test_users_do_not_share_entries(self, user_client):
+        other = Mock()
+        other.display_name = "someone-else"
+        other.garth.oauth2_token.access_token = "token-someone-else"
+        other.get_workout_by_id.return_value = {"workoutId": 1, "workoutName": "Other"}
+
+        api.get_workout_by_id(user_client, 1)
+        assert api.get_workout_by_id(other, 1)["name"] == "Other"
+
+    def test_same_display_name_different_token_not_shared(self, user_client):
+        impostor = Mock()
+        impostor.display_name = user_client.display_name
+        impostor.garth.oauth2_token.access_token = "token-impostor"
+        impostor.get_workout_by_id.return_value = {"workoutId": 1, "workoutName": "Impostor"}
+        impostor.get_scheduled_workouts_for_range.return_value = []
+        impostor.delete_workout.return_value = True
+
+        api.get_workout_by_id(user_client, 1)
+        assert api.get_workout_by_id(impostor, 1)["name"] == "Impostor"
+        api.delete_workout(impostor, 1)
+        api.get_workout_by_id(user_client, 1)
+        user_client.get_workout_by_id.assert_called_once_with(1)
+
+    def test_write_invalidates(self, user_client):
+        user_client.get_scheduled_workouts_for_range.return_value = []
+        user_client.delete_workout.return_value = True
+
+        api.get_workout_by_id(user_client, 1)
+        api.delete_workout(user_client, 1)
+        api.get_workout_by_id(user_client, 1)
+        assert user_client.get_workout_by_id.call_count == 2
+
+    def test_library_pages_share_one_fetch(self, user_client):
+        user_client.get_workouts.return_value = [
+            {"workoutId": i, "workoutName": f"W{i}"} for i in range(3)
+        ]
+        api.get_workouts(user_client, start=0, limit=2)
+        page = api.get_workouts(user_client, start=2, limit=2)
+        assert [w["id"] for w in page["workouts"]] == [2]
+        user_client.get_workouts.assert_called_once()
+
+    def test_create_invalidates_library(self, user_client):
+        user_client.get_workouts.return_value = [{"workoutId": 1, "workoutName": "W1"}]
+        user_client.upload_workout.return_value = {"workoutId": 2, "workoutName": "New"}
+
+        api.get_workouts(user_client)
+        api.create_workout(user_client, {"workoutName": "New", "sport": "running", "steps": []})
+        api.get_workouts(user_client)
+        assert user_client.get_workouts.call_count == 2
+
+    def test_anonymous_client_not_cached(self, client):
+        client.get_workout_by_id.return_value = {"workoutId": 1}
+        api.get_workout_by_id(client, 1)
+        api.get_workout_by_id(client, 1)
+        assert client.get_workout_by_id.call_count == 2
+        assert api._cache == {}
@@ -1,8 +1,12 @@
 """Unit tests for garmin_mcp.utils shared utilities."""
 
+import json
+
 import pytest
+from garmin_mcp import utils
 from garmin_mcp.utils import (
     clean_nones,
+    to_json,
     validate_date,
     format_duration,
     format_distance,
@@ -47,6 +51,27 @@ class TestCleanNones:
         assert result == {"a": [{"b": [{"d": 1}]}]}
 
 
+# ── to_json ──────────────────────────────────────────────────────────────────
+
+
+class TestToJson:
+    def test_compact_by_default(self):
+        data = {"a": 1, "b": [1, 2], "c": {"d": None}}
+        assert to_json(data) == json.dumps(data, separators=(",", ":"))
+
+    def test_pretty_opt_in(self, monkeypatch):
+        monkeypatch.setattr(utils, "PRETTY_JSON", True)
+        data = {"a": 1, "b": [1, 2], "c": {"d": None}}
+        assert to_json(data) == json.dumps(data, indent=2)
+
+    def test_round_trips(self):
+        data = {"name": "Café run", "pace": 3.35, "ok": True}
+        assert json.loads(to_json(data)) == data
+
+    def test_int_keys(self):
+        assert json.loads(to_json({1: "a"})) == {"1": "a"}
+
+
 # ── validate_date ────────────────────────────────────────────────────────────
 
 
@@ -4,6 +4,8 @@ Unit tests for workout normalization functions and Pydantic models.
 Tests that AI-generated simplified workout structures are correctly
 transformed into Garmin Connect API-compatible format.
 """
+import itertools
+
 import pytest
 
 from garmin_mcp.api.workouts import (
@@ -138,7 +140,7 @@ class TestNormalizeExecutableStep:
             "stepType": {"stepTypeId": 1, "stepTypeKey": "warmup"},
             "endCondition": {"conditionTypeId": 2, "conditionTypeKey": "time"},
         }
-        result = _normalize_executable_step(step, [5])
+        result = _normalize_executable_step(step, itertools.count(5).__next__)
         assert result["stepId"] == 5
 
     def test_preserves_existing_step_id(self):
@@ -148,7 +150,7 @@ class TestNormalizeExecutableStep:
             "stepType": {"stepTypeId": 1, "stepTypeKey": "warmup"},
             "endCondition": {"conditionTypeId": 2, "conditionTypeKey": "time"},
         }
-        result = _normalize_executable_step(step, [1])
+        result = _normalize_executable_step(step, itertools.count(1).__next__)
         assert result["stepId"] == 42
 
     def test_fixes_wrong_step_type_id(self):
@@ -386,6 +388,42 @@ class TestRestructureFlatRepeats:
         assert result[0]["workoutSteps"][0]["stepId"] == 2
         assert result[0]["workoutSteps"][1]["stepId"] == 3
 
+    def test_child_listed_before_repeat_not_duplicated(self):
+        steps = [
+            {"stepId": 2, "stepType": {"stepTypeKey": "interval"}},
+            {
+                "stepId": 1,
+                "stepType": {"stepTypeKey": "repeat"},
+                "numberOfIterations": 2,
+                "childStepId": 2,
+            },
+        ]
+        result = _restructure_flat_repeats(steps)
+        assert [s["stepId"] for s in result] == [1]
+        assert result[0]["workoutSteps"][0]["stepId"] == 2
+
+    def test_inner_repeat_listed_before_outer_keeps_children(self):
+        steps = [
+            {
+                "stepId": 2,
+                "stepType": {"stepTypeKey": "repeat"},
+                "numberOfIterations": 3,
+                "childStepId": 3,
+            },
+            {"stepId": 3, "stepType": {"stepTypeKey": "interval"}},
+            {
+                "stepId": 1,
+                "stepType": {"stepTypeKey": "repeat"},
+                "numberOfIterations": 2,
+                "childStepId": 2,
+            },
+        ]
+        result = _restructure_flat_repeats(steps)
+        assert [s["stepId"] for s in result] == [1]
+        inner = result[0]["workoutSteps"]
+        assert [s["stepId"] for s in inner] == [2]
+        assert [s["stepId"] for s in inner[0]["workoutSteps"]] == [3]
+
 
 # =============================================================================
 # normalize_workout_structure Tests (top-level)
@@ -459,6 +497,18 @@ class TestNormalizeWorkoutStructure:
         normalize_workout_structure(data)
         assert "avgTrainingSpeed" not in data
 
+    def test_repeat_call_returns_independent_copy(self):
+        data = {
+            "workoutName": "Memo",
+            "sportType": {"sportTypeId": 1, "sportTypeKey": "running"},
+            "workoutSegments": [],
+        }
+        first = normalize_workout_structure(data)
+        first["sportType"]["displayOrder"] = 99
+        second = normalize_workout_structure(data)
+        assert second["sportType"]["displayOrder"] == 1
+        assert second is not first
+
     def test_full_normalization_pipeline(self):
         """End-to-end: Pydantic model -> dict -> normalize -> Garmin-ready structure"""
         wd = WorkoutData(